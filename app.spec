@@ -5,14 +5,15 @@ a = Analysis(
     ['app.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('templates', 'templates'), ('static', 'static'), ('migrations', 'migrations')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Nothing imports these any more; keep them out even if they are installed in the build environment
+    excludes=['plotly', 'pandas', 'numpy', 'tkinter'],
     noarchive=False,
-    optimize=0,
+    optimize=1,
 )
 pyz = PYZ(a.pure)
 
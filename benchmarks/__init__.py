@@ -0,0 +1 @@
+"""Performance benchmarks for the app. Run them as modules, e.g. `python -m benchmarks.startup`."""
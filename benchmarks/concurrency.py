@@ -0,0 +1,126 @@
+"""Concurrent read/write throughput against a scratch SQLite database.
+
+    python -m benchmarks.concurrency [--readers 4] [--writers 2] [--seconds 10] [--profile tuned|default|both]
+
+Each worker is a separate process with its own app, like gunicorn workers.
+Writers post add_task/add_expense; readers load the task manager and the
+calendar feed. The response cache is disabled so every request hits the
+database. Profiles:
+  default  SQLite's rollback journal with no pragmas, and SQLAlchemy's default pool
+  tuned    the app's SQLITE_PRAGMAS (WAL, synchronous=NORMAL, busy_timeout, ...) and engine options
+Prints one JSON report per profile with operations per second and failed
+requests ("database is locked" surfaces as a 500).
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+PROFILES = {
+    'default': {'SQLITE_PRAGMAS': {}, 'SQLALCHEMY_ENGINE_OPTIONS': {}},
+    'tuned': {},
+}
+
+
+def make_app(database, profile):
+    from wellness import create_app
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}',
+        'RESPONSE_CACHE_BACKEND': 'null',
+        'JOB_RUNNER_AUTOSTART': False,
+        **PROFILES[profile]
+    })
+    app.logger.setLevel(logging.CRITICAL)  # failed requests are counted, not logged
+    return app
+
+
+def seed(database, profile, tasks=2000):
+    from wellness.extensions import db
+    from wellness.models import ExpenseCategory, Task
+    app = make_app(database, profile)
+    with app.app_context():
+        db.create_all()
+        db.session.add(ExpenseCategory(name='Food', color='#FF6384'))
+        today = date.today()
+        db.session.add_all(
+            Task(description=f'task {i}', date=today + timedelta(days=i % 60 - 30), completed=i % 3 == 0)
+            for i in range(tasks)
+        )
+        db.session.commit()
+
+
+def worker(database, profile, role, seconds, results):
+    app = make_app(database, profile)
+    client = app.test_client()
+    today = date.today()
+    month = (today.replace(day=1).isoformat(), (today.replace(day=1) + timedelta(days=32)).replace(day=1).isoformat())
+    ok = failed = 0
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        if role == 'writer':
+            if i % 2:
+                response = client.post('/add_task', data={'description': f'bench {i}', 'date': today.isoformat()})
+            else:
+                response = client.post('/add_expense', data={'description': f'bench {i}', 'amount': '4.5',
+                                                             'category_id': '1'})
+        elif i % 2:
+            response = client.get('/task_manager?filter=month')
+        else:
+            response = client.get(f'/api/calendar/events?start={month[0]}&end={month[1]}')
+        latencies.append(time.perf_counter() - start)
+        if response.status_code < 500:
+            ok += 1
+        else:
+            failed += 1
+        i += 1
+    results.put({'role': role, 'ok': ok, 'failed': failed, 'max_latency': max(latencies, default=0)})
+
+
+def run(profile, readers, writers, seconds):
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'bench.db')
+        seed(database, profile)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=worker, args=(database, profile, role, seconds, results))
+            for role in ['reader'] * readers + ['writer'] * writers
+        ]
+        for process in processes:
+            process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    def totals(role):
+        rows = [report for report in reports if report['role'] == role]
+        return {
+            'ops_per_second': round(sum(row['ok'] for row in rows) / seconds, 1),
+            'failed': sum(row['failed'] for row in rows),
+            'max_latency_ms': round(max((row['max_latency'] for row in rows), default=0) * 1000, 1)
+        }
+
+    return {'profile': profile, 'readers': readers, 'writers': writers, 'seconds': seconds,
+            'reads': totals('reader'), 'writes': totals('writer')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--profile', choices=['tuned', 'default', 'both'], default='both')
+    args = parser.parse_args()
+
+    profiles = ['default', 'tuned'] if args.profile == 'both' else [args.profile]
+    print(json.dumps([run(profile, args.readers, args.writers, args.seconds) for profile in profiles], indent=2))
+
+
+if __name__ == '__main__':
+    main()
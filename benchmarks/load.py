@@ -0,0 +1,270 @@
+"""Route latency and throughput under concurrent load, on synthetic data.
+
+    python -m benchmarks.load [--rows 10000] [--concurrency 4] [--requests 200] [--server] [--output run.json]
+
+Seeds a scratch database with benchmarks.seed (or uses --database, which
+must already be seeded), then loads each route in ROUTES in turn with
+--concurrency worker processes sharing --requests requests. Workers call
+the app through the Flask test client. With --server they go through HTTP
+to a threaded local WSGI server, so the server's thread pool and the
+socket round trip are included. The response cache is disabled unless
+--cache is given, so every request reaches the database.
+
+Prints a JSON report with p50/p95/p99 latency and throughput per route, and
+the peak RSS of the largest app process. Save it with --output to compare
+runs, e.g. before and after a change, at --rows 1000 and 1000000.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+# Name -> path; {month_start} and {next_month} are filled in with the current month
+ROUTES = {
+    'dashboard': '/',
+    'task_manager': '/task_manager',
+    'task_manager_month': '/task_manager?filter=month',
+    'calendar_events': '/api/calendar/events?start={month_start}&end={next_month}',
+    'productivity_report': '/productivity_report',
+    'expenses': '/expenses',
+    'expenses_month': '/expenses?time_filter=month',
+    'water_intake': '/water_intake',
+    'nutrition': '/nutrition',
+    'affirmations': '/affirmations',
+    'api_tasks': '/api/tasks',
+    'api_expenses': '/api/expenses',
+    'chart_task_summary': '/api/charts/task-summary',
+    'chart_task_trend': '/api/charts/task-trend?days=90',
+    'chart_expense_categories': '/api/charts/expense-categories',
+    'chart_water_history': '/api/charts/water-history',
+}
+WARMUP_REQUESTS = 3
+
+
+def peak_rss_kb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS, KiB elsewhere
+    except ImportError:  # Windows
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset // 1024
+        except ImportError:
+            return None
+
+
+def app_config(cache):
+    return {
+        'RESPONSE_CACHE_BACKEND': 'memory' if cache else 'null',
+        'METRICS_ENABLED': False,
+    }
+
+
+def route_paths(names):
+    month_start = date.today().replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return {name: ROUTES[name].format(month_start=month_start, next_month=next_month) for name in names}
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return None
+    rank = max(int(round(p / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+#-------------------------------------------------- Worker processes --------------------------------------------------#
+
+def _test_client_get(database, cache):
+    import logging
+    from benchmarks.seed import make_app
+    app = make_app(database, **app_config(cache))
+    app.logger.setLevel(logging.CRITICAL)  # failed requests are counted, not logged
+    client = app.test_client()
+
+    def get(path):
+        response = client.get(path)
+        response.get_data()
+        return response.status_code
+    return get
+
+
+def _http_get(base_url):
+    import http.client
+    from urllib.parse import urlsplit
+    host = urlsplit(base_url).netloc
+
+    def get(path):
+        connection = http.client.HTTPConnection(host, timeout=60)
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+    return get
+
+
+def worker(conn, target):
+    """Run (path, count) jobs received on `conn` and send back (latencies, errors); None stops the worker."""
+    get = _http_get(target[1]) if target[0] == 'http' else _test_client_get(*target[1:])
+    conn.send('ready')
+    while True:
+        job = conn.recv()
+        if job is None:
+            conn.send({'peak_rss_kb': peak_rss_kb()})
+            return
+        path, count = job
+        for _ in range(WARMUP_REQUESTS):
+            get(path)
+        conn.send('warm')
+        conn.recv()  # start together
+        latencies = []
+        errors = 0
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                status = get(path)
+            except OSError:
+                status = None
+            latencies.append(time.perf_counter() - start)
+            if status is None or status >= 500:
+                errors += 1
+        conn.send((latencies, errors))
+
+
+def server(conn, database, cache):
+    """Serve the app from a threaded WSGI server on a free port until told to stop."""
+    import logging
+    from werkzeug.serving import make_server
+    from benchmarks.seed import make_app
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    app = make_app(database, **app_config(cache))
+    app.logger.setLevel(logging.CRITICAL)
+    httpd = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    conn.send(f'http://127.0.0.1:{httpd.server_port}')
+    conn.recv()
+    httpd.shutdown()
+    conn.send({'peak_rss_kb': peak_rss_kb()})
+
+#-------------------------------------------------------- Runner ------------------------------------------------------#
+
+def load_routes(target, paths, concurrency, requests):
+    """Load each path with `concurrency` workers; returns ({name: stats}, [worker peak RSS in KiB])."""
+    # Spawned, not forked, so each worker's peak RSS is its own and not the seeding parent's
+    context = multiprocessing.get_context('spawn')
+    pipes = []
+    for _ in range(concurrency):
+        parent, child = context.Pipe()
+        context.Process(target=worker, args=(child, target), daemon=True).start()
+        pipes.append(parent)
+    for conn in pipes:
+        conn.recv()
+
+    per_worker = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    results = {}
+    for name, path in paths.items():
+        for conn, count in zip(pipes, per_worker):
+            conn.send((path, count))
+        for conn in pipes:
+            conn.recv()
+        start = time.perf_counter()
+        for conn in pipes:
+            conn.send('go')
+        replies = [conn.recv() for conn in pipes]
+        wall = time.perf_counter() - start
+
+        latencies = sorted(latency for worker_latencies, _ in replies for latency in worker_latencies)
+        errors = sum(worker_errors for _, worker_errors in replies)
+        results[name] = {
+            'path': path,
+            'requests': len(latencies),
+            'errors': errors,
+            'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+            'max_ms': round(latencies[-1] * 1000, 2),
+            'throughput_rps': round(len(latencies) / wall, 1),
+        }
+
+    peaks = []
+    for conn in pipes:
+        conn.send(None)
+        peaks.append(conn.recv()['peak_rss_kb'])
+    return results, peaks
+
+
+def run(database, paths, concurrency, requests, use_server=False, cache=False):
+    if not use_server:
+        results, peaks = load_routes(('app', database, cache), paths, concurrency, requests)
+        app_peaks = peaks
+    else:
+        context = multiprocessing.get_context('spawn')
+        parent, child = context.Pipe()
+        process = context.Process(target=server, args=(child, database, cache), daemon=True)
+        process.start()
+        results, _ = load_routes(('http', parent.recv()), paths, concurrency, requests)
+        parent.send('stop')
+        app_peaks = [parent.recv()['peak_rss_kb']]
+        process.join()
+    app_peaks = [peak for peak in app_peaks if peak is not None]
+    return results, round(max(app_peaks) / 1024, 1) if app_peaks else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000, help='rows per table to seed (see benchmarks.seed)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--database', help='an already seeded SQLite file to use instead of a scratch one')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='requests per route, shared by the workers')
+    parser.add_argument('--routes', nargs='+', choices=list(ROUTES), default=list(ROUTES))
+    parser.add_argument('--server', action='store_true', help='go through HTTP to a threaded local WSGI server')
+    parser.add_argument('--cache', action='store_true', help='keep the response cache enabled')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.abspath(args.database) if args.database else os.path.join(directory, 'bench.db')
+        seed_seconds = None
+        if not args.database:
+            from benchmarks.seed import generate
+            start = time.perf_counter()
+            generate(database, args.rows, args.seed)
+            seed_seconds = round(time.perf_counter() - start, 1)
+        results, peak_rss_mb = run(database, route_paths(args.routes), args.concurrency, args.requests,
+                                   args.server, args.cache)
+
+    report = {
+        'rows': None if args.database else args.rows,
+        'seed': args.seed,
+        'database': args.database,
+        'seed_seconds': seed_seconds,
+        'mode': 'server' if args.server else 'test_client',
+        'concurrency': args.concurrency,
+        'requests_per_route': args.requests,
+        'response_cache': args.cache,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'peak_rss_mb': peak_rss_mb,
+        'routes': results,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""Reproducible synthetic data for benchmarking.
+
+    python -m benchmarks.seed [--rows 10000] [--database instance/bench.db] [--seed 0]
+
+Fills an empty database with `rows` tasks, expenses and water logs spread
+over the two years up to today (tasks also run a month ahead), plus
+rows // 10 affirmations, a fixed set of expense categories and a budget
+per category and month. The derived summary tables (expense rollup, daily
+water totals) are filled in as the app would have. The same --rows and
+--seed always produce the same data. --rows between 10^3 and 10^6 covers
+everything from a new user to years of heavy use.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+CATEGORIES = [
+    ('Food', '#FF6384'), ('Transport', '#36A2EB'), ('Housing', '#FFCE56'), ('Utilities', '#4BC0C0'),
+    ('Health', '#9966FF'), ('Entertainment', '#FF9F40'), ('Shopping', '#C9CBCF'), ('Other', '#7E57C2'),
+]
+WORDS = ['call', 'email', 'review', 'plan', 'buy', 'fix', 'write', 'read', 'clean', 'book', 'pay', 'prepare',
+         'groceries', 'report', 'dentist', 'budget', 'slides', 'garden', 'invoice', 'workout', 'notes', 'meeting']
+HISTORY_DAYS = 730
+BATCH_SIZE = 10000
+
+
+def default_database():
+    from wellness.config import instancedir
+    return os.path.join(instancedir, 'bench.db')
+
+
+def make_app(database, **config):
+    from wellness import create_app
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{database}',
+        'JOB_RUNNER_AUTOSTART': False,
+        **config
+    })
+
+
+def _phrase(rng, words=3):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _insert_batches(model, rows):
+    from wellness.extensions import db
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            db.session.execute(insert(model), batch)
+            batch.clear()
+    if batch:
+        db.session.execute(insert(model), batch)
+
+
+def generate(database, rows=10000, seed=0):
+    """Create the schema in `database` (an SQLite path) and fill it; returns the row count per table."""
+    from wellness.expenses import rebuild_expense_rollup
+    from wellness.extensions import db
+    from wellness.models import (Affirmation, Budget, DEFAULT_WATER_GOAL, Expense, ExpenseCategory, Task,
+                                 WaterDaily, WaterLog)
+
+    rng = random.Random(seed)
+    today = date.today()
+    first_day = today - timedelta(days=HISTORY_DAYS)
+    now = datetime.combine(today, datetime.min.time())
+
+    def timestamp():
+        return now - timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))
+
+    app = make_app(database)
+    with app.app_context():
+        db.create_all()
+        if db.session.query(Task.id).first() is not None:
+            raise SystemExit(f"{database} already has data; seed an empty database")
+
+        db.session.execute(insert(ExpenseCategory), [{'name': name, 'color': color} for name, color in CATEGORIES])
+        category_ids = list(range(1, len(CATEGORIES) + 1))
+
+        months = sorted({(first_day + timedelta(days=d)).replace(day=1) for d in range(HISTORY_DAYS + 31)})
+        db.session.execute(insert(Budget), [
+            {'category_id': category_id, 'amount': rng.randrange(50, 1000, 10), 'month': m.month, 'year': m.year}
+            for m in months for category_id in category_ids
+        ])
+
+        _insert_batches(Task, (
+            {
+                'description': _phrase(rng),
+                'date': first_day + timedelta(days=rng.randrange(HISTORY_DAYS + 31)),
+                'completed': rng.random() < 0.6
+            }
+            for _ in range(rows)
+        ))
+        _insert_batches(Expense, (
+            {
+                'description': _phrase(rng, 2),
+                'amount': round(rng.lognormvariate(3, 1), 2),
+                'timestamp': timestamp(),
+                'category_id': rng.choice(category_ids)
+            }
+            for _ in range(rows)
+        ))
+
+        water_totals = {}
+
+        def water_logs():
+            for _ in range(rows):
+                row = {'timestamp': timestamp(), 'amount': rng.choice((150, 250, 330, 500))}
+                day = row['timestamp'].date()
+                water_totals[day] = water_totals.get(day, 0) + row['amount']
+                yield row
+
+        _insert_batches(WaterLog, water_logs())
+        _insert_batches(WaterDaily, (
+            {'day': day, 'total': total, 'target': DEFAULT_WATER_GOAL} for day, total in sorted(water_totals.items())
+        ))
+        _insert_batches(Affirmation, (
+            {'message': f"{_phrase(rng, 4)}, you've got this."} for _ in range(max(rows // 10, 1))
+        ))
+        db.session.commit()
+        rebuild_expense_rollup()
+
+        return {
+            model.__tablename__: db.session.query(model).count()
+            for model in (Task, Expense, ExpenseCategory, Budget, WaterLog, WaterDaily, Affirmation)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000, help='tasks, expenses and water logs each')
+    parser.add_argument('--database', help='SQLite file to create (default: instance/bench.db)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    database = os.path.abspath(args.database or default_database())
+    start = time.perf_counter()
+    counts = generate(database, args.rows, args.seed)
+    print(json.dumps({'database': database, 'rows': args.rows, 'seed': args.seed,
+                      'seconds': round(time.perf_counter() - start, 1), 'tables': counts}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Cold-start benchmark: import time and memory of `import app` in fresh interpreters.
+
+    python -m benchmarks.startup [--runs 5] [--module app]
+
+Each run starts a new Python process, so nothing is cached between runs apart
+from the OS file cache. Prints a JSON report with the median and best import
+time, the peak RSS, and which heavy third-party modules ended up imported.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that should stay out of startup; any of them showing up here is a regression
+HEAVY_MODULES = ['plotly', 'pandas', 'numpy', 'apscheduler']
+
+# Runs inside the child process and prints one JSON line
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_kb = peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS, KiB elsewhere
+except ImportError:  # Windows
+    try:
+        import psutil
+        peak_kb = psutil.Process().memory_info().peak_wset // 1024
+    except ImportError:
+        peak_kb = None
+print(json.dumps({{
+    'import_seconds': elapsed,
+    'peak_rss_kb': peak_kb,
+    'modules': len(sys.modules),
+    'heavy': sorted(name for name in {heavy!r} if name in sys.modules)
+}}))
+"""
+
+
+def measure(module):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, JOB_RUNNER_AUTOSTART='0')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=root, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--module', default='app', help='module to import (default: app)')
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    times = [run['import_seconds'] for run in runs]
+    rss = [run['peak_rss_kb'] for run in runs if run['peak_rss_kb'] is not None]
+    print(json.dumps({
+        'module': args.module,
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'import_ms_median': round(statistics.median(times) * 1000, 1),
+        'import_ms_best': round(min(times) * 1000, 1),
+        'peak_rss_mb': round(max(rss) / 1024, 1) if rss else None,
+        'modules_loaded': runs[-1]['modules'],
+        'heavy_modules_loaded': runs[-1]['heavy']
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
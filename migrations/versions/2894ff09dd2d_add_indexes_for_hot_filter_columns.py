@@ -0,0 +1,55 @@
+"""Add indexes for hot filter columns
+
+Revision ID: 2894ff09dd2d
+Revises: de4c42d83349
+Create Date: 2026-10-18 09:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2894ff09dd2d'
+down_revision = 'de4c42d83349'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_date', ['date'], unique=False)
+        batch_op.create_index('ix_task_completed_date', ['completed', 'date'], unique=False)
+
+    with op.batch_alter_table('water_log', schema=None) as batch_op:
+        batch_op.create_index('ix_water_log_timestamp', ['timestamp'], unique=False)
+
+    with op.batch_alter_table('expense', schema=None) as batch_op:
+        batch_op.create_index('ix_expense_timestamp', ['timestamp'], unique=False)
+        batch_op.create_index('ix_expense_category_timestamp', ['category_id', 'timestamp'], unique=False)
+
+    # Keep only the newest budget per category/month/year before enforcing uniqueness
+    op.execute(
+        "DELETE FROM budget WHERE id NOT IN ("
+        "SELECT MAX(id) FROM budget GROUP BY category_id, month, year)"
+    )
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_budget_category_month_year', ['category_id', 'month', 'year'])
+        batch_op.create_index('ix_budget_year_month', ['year', 'month'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('budget', schema=None) as batch_op:
+        batch_op.drop_index('ix_budget_year_month')
+        batch_op.drop_constraint('uq_budget_category_month_year', type_='unique')
+
+    with op.batch_alter_table('expense', schema=None) as batch_op:
+        batch_op.drop_index('ix_expense_category_timestamp')
+        batch_op.drop_index('ix_expense_timestamp')
+
+    with op.batch_alter_table('water_log', schema=None) as batch_op:
+        batch_op.drop_index('ix_water_log_timestamp')
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_completed_date')
+        batch_op.drop_index('ix_task_date')
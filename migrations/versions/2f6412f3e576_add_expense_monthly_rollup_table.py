@@ -0,0 +1,50 @@
+"""Add expense monthly rollup table
+
+Revision ID: 2f6412f3e576
+Revises: 2894ff09dd2d
+Create Date: 2026-10-18 10:03:47.915260
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6412f3e576'
+down_revision = '2894ff09dd2d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('expense_monthly_rollup',
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Float(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['expense_category.id'], ),
+    sa.PrimaryKeyConstraint('category_id', 'year', 'month')
+    )
+    with op.batch_alter_table('expense_monthly_rollup', schema=None) as batch_op:
+        batch_op.create_index('ix_expense_monthly_rollup_year_month', ['year', 'month'], unique=False)
+
+    # Backfill from existing expenses (same as `flask rebuild-expense-rollup`); built with
+    # SQLAlchemy expressions so the year/month extraction compiles for any backend
+    expense = sa.table('expense', sa.column('id'), sa.column('amount'), sa.column('timestamp'), sa.column('category_id'))
+    rollup = sa.table('expense_monthly_rollup', sa.column('category_id'), sa.column('year'), sa.column('month'),
+                      sa.column('total'), sa.column('count'))
+    year = sa.extract('year', expense.c.timestamp)
+    month = sa.extract('month', expense.c.timestamp)
+    op.execute(rollup.insert().from_select(
+        ['category_id', 'year', 'month', 'total', 'count'],
+        sa.select(expense.c.category_id, year, month, sa.func.sum(expense.c.amount), sa.func.count(expense.c.id))
+        .where(expense.c.category_id.is_not(None), expense.c.timestamp.is_not(None))
+        .group_by(expense.c.category_id, year, month)
+    ))
+
+def downgrade():
+    with op.batch_alter_table('expense_monthly_rollup', schema=None) as batch_op:
+        batch_op.drop_index('ix_expense_monthly_rollup_year_month')
+
+    op.drop_table('expense_monthly_rollup')
@@ -0,0 +1,41 @@
+"""Add exercise catalog table
+
+Revision ID: 9505634780ca
+Revises: 2f6412f3e576
+Create Date: 2026-10-18 13:26:05.118834
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9505634780ca'
+down_revision = '2f6412f3e576'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('exercise',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=True),
+    sa.Column('muscle', sa.String(length=50), nullable=False),
+    sa.Column('equipment', sa.String(length=100), nullable=True),
+    sa.Column('difficulty', sa.String(length=50), nullable=True),
+    sa.Column('instructions', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('muscle', 'name', name='uq_exercise_muscle_name')
+    )
+    with op.batch_alter_table('exercise', schema=None) as batch_op:
+        batch_op.create_index('ix_exercise_type', ['type'], unique=False)
+        batch_op.create_index('ix_exercise_difficulty', ['difficulty'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('exercise', schema=None) as batch_op:
+        batch_op.drop_index('ix_exercise_difficulty')
+        batch_op.drop_index('ix_exercise_type')
+
+    op.drop_table('exercise')
@@ -0,0 +1,37 @@
+"""Add meal table
+
+Revision ID: 990dbee069a3
+Revises: 9505634780ca
+Create Date: 2026-10-18 14:02:51.674402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '990dbee069a3'
+down_revision = '9505634780ca'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('meal',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('food', sa.String(length=200), nullable=False),
+    sa.Column('calories', sa.Integer(), nullable=False),
+    sa.Column('protein', sa.Integer(), nullable=False),
+    sa.Column('meal_type', sa.String(length=20), nullable=True),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('meal', schema=None) as batch_op:
+        batch_op.create_index('ix_meal_timestamp', ['timestamp'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('meal', schema=None) as batch_op:
+        batch_op.drop_index('ix_meal_timestamp')
+
+    op.drop_table('meal')
@@ -0,0 +1,53 @@
+"""Add recurring task tables
+
+Revision ID: ca8b4db70e84
+Revises: cda8a33528aa
+Create Date: 2026-10-18 08:40:24.865618
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ca8b4db70e84'
+down_revision = 'cda8a33528aa'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('recurring_task',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=200), nullable=False),
+    sa.Column('frequency', sa.String(length=10), nullable=False),
+    sa.Column('interval', sa.Integer(), nullable=False),
+    sa.Column('weekdays', sa.String(length=7), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('recurring_task', schema=None) as batch_op:
+        batch_op.create_index('ix_recurring_task_start_end', ['start_date', 'end_date'], unique=False)
+
+    op.create_table('recurring_task_exception',
+    sa.Column('recurring_task_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('skipped', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['recurring_task_id'], ['recurring_task.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('recurring_task_id', 'date')
+    )
+    with op.batch_alter_table('recurring_task_exception', schema=None) as batch_op:
+        batch_op.create_index('ix_recurring_task_exception_date', ['date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('recurring_task_exception', schema=None) as batch_op:
+        batch_op.drop_index('ix_recurring_task_exception_date')
+
+    op.drop_table('recurring_task_exception')
+    with op.batch_alter_table('recurring_task', schema=None) as batch_op:
+        batch_op.drop_index('ix_recurring_task_start_end')
+
+    op.drop_table('recurring_task')
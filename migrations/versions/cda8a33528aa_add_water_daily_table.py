@@ -0,0 +1,36 @@
+"""Add water daily summary table
+
+Revision ID: cda8a33528aa
+Revises: 990dbee069a3
+Create Date: 2026-10-18 14:48:19.530617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cda8a33528aa'
+down_revision = '990dbee069a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('water_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('target', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    # Backfill one row per day from the existing logs, using the old hardcoded 2000 ml goal
+    op.execute(
+        "INSERT INTO water_daily (day, total, target) "
+        "SELECT date(timestamp), SUM(amount), 2000 FROM water_log "
+        "WHERE timestamp IS NOT NULL GROUP BY date(timestamp)"
+    )
+
+
+def downgrade():
+    op.drop_table('water_daily')
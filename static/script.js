@@ -1,3 +1,56 @@
+// Charts: each [data-chart] element is filled from its data-chart-url (/api/charts/<name>, columnar JSON),
+// or from its data-chart-series entry when several charts share one payload (each URL is fetched once).
+// The data is requested as soon as this script runs, in parallel with the deferred Plotly bundle,
+// and drawn once the DOM (and so Plotly) is ready. Styling and titles for each chart live here.
+const CHARTS = {
+    'task-status': data => [
+        [{x: data.labels, y: data.values, type: 'bar', marker: {color: ['#4CAF50', '#F44336']}}],
+        {title: 'Task Completion Status', yaxis: {title: 'Number of Tasks'}, height: 450}
+    ],
+    'tasks-completed': data => [
+        [{x: data.labels, y: data.values, type: 'bar', marker: {color: ['#2196F3', '#FF9800', '#9C27B0']}}],
+        {title: 'Tasks Completed Over Time', yaxis: {title: 'Tasks Completed'}, height: 450}
+    ],
+    'task-trend': data => [
+        [{x: data.x, y: data.y, type: 'scatter', mode: 'lines+markers', line: {color: '#4CAF50'}}],
+        {title: `Tasks Completed Per Day (Last ${data.days} Days)`, yaxis: {title: 'Tasks Completed'}, height: 450}
+    ],
+    'expense-categories': data => [
+        [{values: data.values, labels: data.labels, marker: {colors: data.colors}, type: 'pie'}],
+        {title: 'Expense by Category'}
+    ],
+    'expense-trend': data => [
+        [{x: data.x, y: data.y, type: 'bar'}],
+        {title: 'Monthly Spending Trend'}
+    ],
+    'water-history': data => [
+        [
+            {x: data.x, y: data.total, type: 'bar', name: 'Intake'},
+            {x: data.x, y: data.target, type: 'scatter', mode: 'lines', name: 'Goal'}
+        ],
+        {yaxis: {title: 'ml'}}
+    ]
+};
+
+const domReady = new Promise(resolve => document.addEventListener('DOMContentLoaded', resolve));
+
+const chartRequests = {};
+
+document.querySelectorAll('[data-chart]').forEach(element => {
+    const url = element.dataset.chartUrl;
+    chartRequests[url] = chartRequests[url] || fetch(url).then(response => {
+        if (!response.ok) throw new Error(`Chart request failed (${response.status})`);
+        return response.json();
+    });
+    Promise.all([chartRequests[url], domReady]).then(([data]) => {
+        const series = element.dataset.chartSeries;
+        const [traces, layout] = CHARTS[element.dataset.chart](series ? data[series] : data);
+        Plotly.newPlot(element, traces, {autosize: true, ...layout}, {responsive: true});
+    }).catch(() => {
+        element.textContent = 'Chart unavailable';
+    });
+});
+
 // Wait for the DOM to be fully loaded
 document.addEventListener('DOMContentLoaded', function () {
     // Highlight Active Navigation Link
@@ -15,10 +68,8 @@ document.addEventListener('DOMContentLoaded', function () {
     // Water Intake Progress Bar (Optional Visualization)
     const progressBarFill = document.querySelector('.progress-bar-fill');
     if (progressBarFill) {
-        const dailyGoal = 2000; // Example: Set daily goal to 2000ml
-        const totalIntake = parseInt(progressBarFill.dataset.intake, 10) || 0;
-
-        const progressPercentage = Math.min((totalIntake / dailyGoal) * 100, 100);
+        // Progress against the stored daily goal is computed server-side
+        const progressPercentage = Math.min(parseFloat(progressBarFill.dataset.progress) || 0, 100);
         progressBarFill.style.width = `${progressPercentage}%`;
         progressBarFill.textContent = `${Math.round(progressPercentage)}%`;
     }
@@ -49,6 +100,65 @@ document.addEventListener('DOMContentLoaded', function () {
         }, 3000);
     };
 
+    // Task Manager: complete/delete tasks through the batch API and update the cards in place
+    const taskCards = document.querySelector('.task-cards[data-batch-url]');
+    if (taskCards) {
+        const applyResults = (results) => {
+            results.forEach(result => {
+                const card = taskCards.querySelector(`.task-card[data-task-id="${result.id}"]`);
+                if (!card) return;
+                if (result.status === 'deleted' || result.status === 'not_found') {
+                    card.remove();
+                } else if (result.status === 'completed') {
+                    card.classList.add('completed');
+                    const completeLink = card.querySelector('[data-task-op="complete"]');
+                    if (completeLink) {
+                        const status = document.createElement('span');
+                        status.className = 'status';
+                        status.textContent = '✔ Completed';
+                        completeLink.replaceWith(status);
+                    }
+                }
+            });
+        };
+
+        const runBatch = (operations) => fetch(taskCards.dataset.batchUrl, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({operations})
+        }).then(response => {
+            if (!response.ok) throw new Error(`Batch request failed (${response.status})`);
+            return response.json();
+        }).then(data => {
+            applyResults(data.results);
+            const failed = data.results.filter(result => result.status === 'error').length;
+            showToast(failed ? `${failed} task change(s) failed` : 'Tasks updated');
+        }).catch(error => showToast(error.message));
+
+        // Single-task links fall back to the plain GET routes if the script is not running
+        taskCards.addEventListener('click', function (event) {
+            const link = event.target.closest('[data-task-op]');
+            if (!link) return;
+            event.preventDefault();
+            const id = parseInt(link.closest('.task-card').dataset.taskId, 10);
+            runBatch([{op: link.dataset.taskOp, id}]);
+        });
+
+        document.querySelectorAll('[data-batch-op]').forEach(button => {
+            button.addEventListener('click', function () {
+                const op = button.dataset.batchOp;
+                const ids = [...taskCards.querySelectorAll('.task-select input:checked')]
+                    .map(input => parseInt(input.value, 10));
+                if (!ids.length) {
+                    showToast('Select some tasks first');
+                    return;
+                }
+                if (op === 'delete' && !confirm(`Delete ${ids.length} task(s)?`)) return;
+                runBatch(ids.map(id => ({op, id})));
+            });
+        });
+    }
+
     // Example Usage: Trigger Toast on Button Click
     const actionButtons = document.querySelectorAll('.action-button');
     actionButtons.forEach(button => {
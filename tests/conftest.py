@@ -0,0 +1,24 @@
+import pytest
+
+from wellness import create_app
+from wellness.extensions import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'RESPONSE_CACHE_BACKEND': 'null',
+        'JOB_RUNNER_AUTOSTART': False,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
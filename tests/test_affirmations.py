@@ -0,0 +1,64 @@
+import random
+from collections import Counter
+
+import pytest
+
+from wellness.affirmations import invalidate_affirmation_count, random_affirmation
+from wellness.dashboard import explain_query_plan
+from wellness.extensions import db, request_metrics
+from wellness.models import Affirmation
+
+
+@pytest.fixture(autouse=True)
+def fresh_count():
+    invalidate_affirmation_count()  # the cached count is per process, not per app
+
+
+def test_random_affirmation_is_uniform_over_dense_ids(app):
+    with app.app_context():
+        db.session.add_all(Affirmation(message=f'a{i}') for i in range(4))
+        db.session.commit()
+        random.seed(0)
+        picks = Counter(random_affirmation('default') for _ in range(800))
+    assert set(picks) == {'a0', 'a1', 'a2', 'a3'}
+    assert all(150 < picks[message] < 250 for message in picks)
+
+
+def test_random_affirmation_seeks_by_id(app):
+    with app.app_context():
+        db.session.add_all(Affirmation(message=f'a{i}') for i in range(3))
+        db.session.commit()
+        random_affirmation('default')  # caches the count and id range
+        with request_metrics.record_queries() as queries:
+            random_affirmation('default')
+        assert len(queries) == 1
+        plan = explain_query_plan(queries[0].statement, queries[0].parameters)
+    assert plan == ['SEARCH affirmation USING INTEGER PRIMARY KEY (rowid>?)']
+
+
+def test_random_affirmation_wraps_past_deleted_last_rows(app):
+    with app.app_context():
+        db.session.add_all(Affirmation(message=f'a{i}') for i in range(10))
+        db.session.commit()
+        random_affirmation('default')  # caches ids 1..10
+        Affirmation.query.filter(Affirmation.id.between(2, 10)).delete()
+        db.session.commit()
+        assert all(random_affirmation('default') == 'a0' for _ in range(20))
+
+
+def test_random_affirmation_sees_new_rows_immediately(app, client):
+    with app.app_context():
+        assert random_affirmation('default') == 'default'
+    client.post('/affirmations', data={'message': 'You can do it'})
+    with app.app_context():
+        assert random_affirmation('default') == 'You can do it'
+
+
+def test_random_affirmation_recounts_after_deletes(app):
+    with app.app_context():
+        db.session.add_all(Affirmation(message=f'a{i}') for i in range(5))
+        db.session.commit()
+        random_affirmation('default')  # caches a count of 5
+        Affirmation.query.filter(Affirmation.id > 1).delete()
+        db.session.commit()
+        assert all(random_affirmation('default') == 'a0' for _ in range(20))
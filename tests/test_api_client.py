@@ -0,0 +1,124 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from wellness.api_client import ApiClient, CircuitOpenError
+
+
+class StubUpstream(ThreadingHTTPServer):
+    """Local HTTP server answering every GET with `status` (after `delay` seconds, or once `gate` is set)."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.status = 200
+        self.delay = 0
+        self.gate = None
+        self.hits = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+        if server.gate is not None:
+            server.gate.wait(5)
+        time.sleep(server.delay)
+        body = b'{"ok": true}'
+        self.send_response(server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = StubUpstream()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    if server.gate is not None:
+        server.gate.set()
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(upstream, **kwargs):
+    options = {'retries': 0, 'backoff': 0, 'failure_threshold': 2, 'reset_timeout': 0.2, 'timeout': (1, 1)}
+    return ApiClient(upstream.url, **{**options, **kwargs})
+
+
+def test_retries_server_errors(upstream):
+    upstream.status = 503
+    client = make_client(upstream, retries=2, failure_threshold=10)
+    with pytest.raises(requests.HTTPError):
+        client.get_json('/')
+    assert upstream.hits == 3
+
+
+def test_read_timeout_counts_as_failure(upstream):
+    upstream.delay = 0.5
+    client = make_client(upstream, timeout=(1, 0.1), failure_threshold=1)
+    with pytest.raises(requests.RequestException, match='Read timed out'):
+        client.get_json('/')
+    with pytest.raises(CircuitOpenError):
+        client.get_json('/')
+
+
+def test_circuit_opens_and_recovers_through_one_probe(upstream):
+    upstream.status = 500
+    client = make_client(upstream)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get_json('/')
+    with pytest.raises(CircuitOpenError):
+        client.get_json('/')
+    assert upstream.hits == 2
+
+    # Half-open: while the probe is held at the upstream, every other caller is turned away
+    time.sleep(0.25)
+    upstream.status = 200
+    upstream.gate = threading.Event()
+    probe_result = []
+    probe = threading.Thread(target=lambda: probe_result.append(client.get_json('/')))
+    probe.start()
+    while upstream.hits < 3:
+        time.sleep(0.01)
+    rejected = 0
+    for _ in range(5):
+        with pytest.raises(CircuitOpenError):
+            client.get_json('/')
+        rejected += 1
+    upstream.gate.set()
+    probe.join(5)
+
+    assert probe_result == [{'ok': True}] and rejected == 5 and upstream.hits == 3
+    assert client.get_json('/') == {'ok': True}
+
+
+def test_failed_probe_reopens_circuit(upstream):
+    upstream.status = 500
+    client = make_client(upstream)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get_json('/')
+    time.sleep(0.25)
+    with pytest.raises(requests.HTTPError):
+        client.get_json('/')
+    with pytest.raises(CircuitOpenError):
+        client.get_json('/')
+    assert upstream.hits == 3
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from wellness import assets
+from wellness.assets import VENDOR, minify_js
+
+
+@pytest.fixture
+def fallback_minifier(monkeypatch):
+    monkeypatch.setattr(assets, 'rjsmin', None)
+
+
+def test_minify_keeps_template_literals(fallback_minifier):
+    source = (
+        "// comment\n"
+        "const url = `http://example.com/${ {a: `//${'x'}`}.a }`;  // trailing\n"
+        "    const re = /\\/\\/[/]/g, half = 1 / 2; /* block */\n"
+        "const s = 'it\\'s // here';\n"
+    )
+    assert minify_js(source) == (
+        "const url = `http://example.com/${ {a: `//${'x'}`}.a }`;\n"
+        "const re = /\\/\\/[/]/g, half = 1 / 2;\n"
+        "const s = 'it\\'s // here';\n"
+    )
+
+
+def test_minify_script_js(app, fallback_minifier):
+    with open(os.path.join(app.static_folder, 'script.js'), encoding='utf-8') as f:
+        source = f.read()
+    minified = minify_js(source)
+    assert len(minified) < len(source)
+    assert '// Charts:' not in minified
+    assert '`Chart request failed (${response.status})`' in minified
+    # Nothing is joined or reordered: the code lines are the source's, stripped
+    code = [line.strip() for line in source.splitlines() if line.strip() and not line.strip().startswith('//')]
+    assert minified.splitlines() == code
+
+
+def test_build_fails_without_vendor_files(app, tmp_path):
+    app.static_folder = str(tmp_path)
+    (tmp_path / 'style.css').write_text('body { color: red; }')
+    result = app.test_cli_runner().invoke(args=['build-assets'])
+    assert result.exit_code != 0
+    assert all(name in result.output for name in VENDOR)
+    assert not (tmp_path / 'dist').exists()
@@ -0,0 +1,77 @@
+from datetime import date, datetime
+
+from wellness.expenses import (monthly_expense_trend, rebuild_expense_rollup, reconcile_expense_rollup,
+                               record_expenses_in_rollup)
+from wellness.extensions import db
+from wellness.models import Budget, Expense, ExpenseCategory, ExpenseMonthlyRollup
+
+
+def add_expenses(*rows):
+    """Insert (amount, timestamp, category_id) expenses and keep the rollup in step, as the import does."""
+    expenses = [{'description': 'x', 'amount': amount, 'timestamp': timestamp, 'category_id': category_id}
+                for amount, timestamp, category_id in rows]
+    db.session.execute(db.insert(Expense), expenses)
+    record_expenses_in_rollup(expenses)
+    db.session.commit()
+
+
+def rollup_rows():
+    return {(r.category_id, r.year, r.month): (r.total, r.count) for r in ExpenseMonthlyRollup.query}
+
+
+def test_trend_includes_uncategorised_spend(app):
+    with app.app_context():
+        db.session.add(ExpenseCategory(name='Food', color='#123456'))
+        db.session.commit()
+        add_expenses((10, datetime(2026, 8, 3), 1), (5, datetime(2026, 8, 20), None),
+                     (7, datetime(2026, 9, 1), None), (100, datetime(2026, 11, 1), None))
+        trend = monthly_expense_trend([date(2026, 8, 1), date(2026, 9, 1), date(2026, 10, 1)])
+    assert trend == [{'date': 'Aug 2026', 'total': 15}, {'date': 'Sep 2026', 'total': 7},
+                     {'date': 'Oct 2026', 'total': 0}]
+
+
+def test_reconcile_only_touches_recent_months(app):
+    with app.app_context():
+        db.session.add(ExpenseCategory(name='Food', color='#123456'))
+        db.session.commit()
+        add_expenses((10, datetime(2026, 7, 3), 1), (20, datetime(2026, 9, 3), 1), (30, datetime(2026, 10, 3), 1))
+        db.session.execute(db.update(ExpenseMonthlyRollup).values(total=0, count=0))
+        # drift: zeroed rollup rows plus an expense written without touching the rollup
+        db.session.add(Expense(description='late', amount=2, timestamp=datetime(2026, 9, 30), category_id=1))
+        db.session.commit()
+
+        reconcile_expense_rollup(date(2026, 10, 18))
+        assert rollup_rows() == {(1, 2026, 7): (0, 0), (1, 2026, 9): (22, 2), (1, 2026, 10): (30, 1)}
+
+        rebuild_expense_rollup()
+        assert rollup_rows() == {(1, 2026, 7): (10, 1), (1, 2026, 9): (22, 2), (1, 2026, 10): (30, 1)}
+
+
+def test_delete_updates_rollup_but_never_creates_a_row(app, client):
+    with app.app_context():
+        db.session.add(ExpenseCategory(name='Food', color='#123456'))
+        db.session.commit()
+        add_expenses((10, datetime(2026, 9, 3), 1), (4, datetime(2026, 9, 5), 1))
+        # A month that was never backfilled: its expense exists but the rollup has no row for it
+        db.session.add(Expense(description='old', amount=7, timestamp=datetime(2020, 1, 1), category_id=1))
+        db.session.commit()
+
+    for expense_id in (1, 3):
+        assert client.post(f'/delete_expense/{expense_id}').status_code == 302
+    with app.app_context():
+        assert rollup_rows() == {(1, 2026, 9): (4, 1)}
+        assert {expense.id for expense in Expense.query} == {2}
+
+
+def test_uncategorised_expense_ignores_null_category_budgets(app, client):
+    with app.app_context():
+        today = datetime.today()
+        # The unique constraint doesn't stop these: NULLs never compare equal
+        db.session.execute(db.insert(Budget), [
+            {'category_id': None, 'amount': 5, 'month': today.month, 'year': today.year}] * 2)
+        db.session.commit()
+
+    response = client.post('/add_expense', data={'description': 'Snack', 'amount': '9'})
+    assert response.status_code == 302
+    with app.app_context():
+        assert [expense.description for expense in Expense.query] == ['Snack']
@@ -0,0 +1,73 @@
+from datetime import datetime
+from html import unescape
+import re
+
+from wellness.extensions import db, request_metrics
+from wellness.helpers import keyset_page
+from wellness.models import Expense
+
+# id -> timestamp; ids 3 and 5 are legacy rows without one
+TIMESTAMPS = {
+    1: datetime(2025, 1, 1), 2: datetime(2025, 1, 3), 3: None, 4: datetime(2025, 1, 3), 5: None,
+    6: datetime(2025, 1, 2),
+}
+NEWEST_FIRST = [4, 2, 6, 1, 5, 3]
+
+
+def add_expenses(app):
+    with app.app_context():
+        db.session.add_all(Expense(id=expense_id, description=f'e{expense_id}', amount=1, timestamp=timestamp)
+                           for expense_id, timestamp in TIMESTAMPS.items())
+        db.session.flush()
+        # The column default fills in a None on insert, so clear the legacy timestamps afterwards
+        missing = [expense_id for expense_id, timestamp in TIMESTAMPS.items() if timestamp is None]
+        db.session.execute(db.update(Expense).where(Expense.id.in_(missing)).values(timestamp=None))
+        db.session.commit()
+
+
+def test_api_pages_through_rows_without_timestamp(app, client):
+    add_expenses(app)
+    ids, cursors, after = [], [], None
+    while True:
+        response = client.get('/api/expenses', query_string={'per_page': 2, **({'after': after} if after else {})})
+        assert response.status_code == 200
+        page = response.get_json()
+        ids += [expense['id'] for expense in page['expenses']]
+        after = page['next_cursor']
+        if after is None:
+            break
+        cursors.append(after)
+    assert ids == NEWEST_FIRST
+    assert cursors == ['2025-01-03T00:00:00,2', '2025-01-01T00:00:00,1']
+
+
+def test_streamed_page_cursor_into_rows_without_timestamp(app, client):
+    add_expenses(app)
+    html = client.get('/expenses', query_string={'per_page': 5}).get_data(as_text=True)
+    assert re.findall(r'class="expense-desc">e(\d)<', html) == [str(i) for i in NEWEST_FIRST[:5]]
+    assert 'after=,5"' in unescape(html)
+
+    html = client.get('/expenses', query_string={'per_page': 5, 'after': ',5'}).get_data(as_text=True)
+    assert re.findall(r'class="expense-desc">e(\d)<', html) == ['3']
+
+
+def test_ascending_pages_list_rows_without_value_first(app):
+    add_expenses(app)
+    with app.app_context():
+        ids, cursor = [], None
+        while True:
+            rows, next_cursor = keyset_page(Expense.query, Expense.timestamp, Expense.id, cursor, 4)
+            ids += [row.id for row in rows]
+            if next_cursor is None:
+                break
+            value, _, last_id = next_cursor.rpartition(',')
+            cursor = (datetime.fromisoformat(value) if value else None, int(last_id))
+    assert ids == [3, 5, 1, 6, 2, 4]
+
+
+def test_time_filter_skips_the_null_timestamp_query(app, client):
+    add_expenses(app)
+    with request_metrics.record_queries() as queries:
+        page = client.get('/api/expenses', query_string={'time_filter': 'week'}).get_json()
+    assert page['expenses'] == []
+    assert not any('IS NULL' in query.statement for query in queries)
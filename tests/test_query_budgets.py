@@ -0,0 +1,50 @@
+import pytest
+
+from wellness.dashboard import QUERY_BUDGETS
+from wellness.extensions import db, request_metrics
+from wellness.metrics import QueryBudgetExceeded
+
+
+@pytest.mark.parametrize('path', ['/water_intake', '/expenses', '/task_manager', '/api/charts/task-summary'])
+def test_page_within_budget(client, path):
+    with request_metrics.assert_max_queries(QUERY_BUDGETS[path]):
+        response = client.get(path)
+        response.get_data()  # streamed pages query while the body is read
+    assert response.status_code == 200
+
+
+def test_water_intake_within_budget_once_logged(client):
+    client.post('/water_intake', data={'amount': '250'})
+    with request_metrics.assert_max_queries(QUERY_BUDGETS['/water_intake']):
+        response = client.get('/water_intake')
+    assert b'250 ml' in response.data
+
+
+def test_over_budget_lists_statements(client):
+    with pytest.raises(QueryBudgetExceeded, match=r'queries \(budget 0\):\n  SELECT'):
+        with request_metrics.assert_max_queries(0):
+            client.get('/water_intake')
+
+
+def test_check_query_budgets_command(app):
+    result = app.test_cli_runner().invoke(args=['check-query-budgets'])
+    assert result.exit_code == 0, result.output
+    assert 'OVER' not in result.output
+
+
+def test_check_indexes_explains_the_views_own_statements(app):
+    result = app.test_cli_runner().invoke(args=['check-indexes'])
+    assert result.exit_code == 0, result.output
+    # captured from filtered_expense_query + keyset_page and the calendar range query, not a hand-written copy
+    assert 'expense.category_id = ? AND expense.timestamp >= ? AND expense.timestamp < ? ORDER BY' in result.output
+    assert 'FROM task WHERE task.completed = 0 AND task.date >= ? AND task.date < ?' in result.output
+    assert 'USING INDEX ix_expense_category_timestamp' in result.output
+
+
+def test_check_indexes_fails_on_a_missing_index(app):
+    with app.app_context():
+        db.session.execute(db.text('DROP INDEX ix_task_date'))
+        db.session.commit()
+    result = app.test_cli_runner().invoke(args=['check-indexes'])
+    assert result.exit_code != 0
+    assert 'SCAN   SCAN task\n' in result.output
@@ -0,0 +1,95 @@
+from datetime import date, datetime, timedelta
+
+from wellness.extensions import db
+from wellness.models import RecurringTask, Task
+from wellness.recurrence import expand_occurrences, occurrence_dates, set_exception
+
+
+def rule(frequency, start_date, interval=1, weekdays=None, end_date=None, description='Water plants'):
+    return RecurringTask(description=description, frequency=frequency, interval=interval, weekdays=weekdays,
+                         start_date=start_date, end_date=end_date)
+
+
+def add_rule(app, **kwargs):
+    with app.app_context():
+        row = rule(**kwargs)
+        db.session.add(row)
+        db.session.commit()
+        return row.id
+
+
+def test_daily_interval_aligned_to_start_date():
+    every_third = rule('daily', date(2025, 1, 1), interval=3)
+    # The range starts mid-cycle (occurrences fall on Jan 1, 4, 7, 10, ...), so the first one in it is Jan 13
+    assert occurrence_dates(every_third, date(2025, 1, 11), date(2025, 1, 20)) == [
+        date(2025, 1, 13), date(2025, 1, 16), date(2025, 1, 19)]
+    assert occurrence_dates(every_third, date(2024, 12, 25), date(2025, 1, 5)) == [
+        date(2025, 1, 1), date(2025, 1, 4)]
+
+
+def test_weekly_on_days_every_other_week():
+    # Mon/Wed/Fri every second week, counted from the week the rule starts in (starts Wed 2025-01-01)
+    mwf = rule('weekly', date(2025, 1, 1), interval=2, weekdays='024')
+    assert occurrence_dates(mwf, date(2024, 12, 30), date(2025, 1, 20)) == [
+        date(2025, 1, 1), date(2025, 1, 3), date(2025, 1, 13), date(2025, 1, 15), date(2025, 1, 17)]
+
+
+def test_weekly_defaults_to_start_weekday():
+    weekly = rule('weekly', date(2025, 1, 1))
+    assert occurrence_dates(weekly, date(2025, 1, 1), date(2025, 1, 22)) == [
+        date(2025, 1, 1), date(2025, 1, 8), date(2025, 1, 15)]
+
+
+def test_monthly_on_the_31st_skips_short_months():
+    month_end = rule('monthly', date(2025, 1, 31))
+    assert occurrence_dates(month_end, date(2025, 1, 1), date(2025, 8, 1)) == [
+        date(2025, 1, 31), date(2025, 3, 31), date(2025, 5, 31), date(2025, 7, 31)]
+
+
+def test_monthly_on_the_29th_in_and_out_of_leap_years():
+    rent = rule('monthly', date(2023, 12, 29), interval=2)
+    assert occurrence_dates(rent, date(2024, 1, 1), date(2024, 7, 1)) == [
+        date(2024, 2, 29), date(2024, 4, 29), date(2024, 6, 29)]
+    assert occurrence_dates(rent, date(2025, 1, 1), date(2025, 5, 1)) == [date(2025, 4, 29)]
+
+
+def test_end_date_is_the_last_possible_occurrence():
+    daily = rule('daily', date(2025, 1, 1), end_date=date(2025, 1, 3))
+    assert occurrence_dates(daily, date(2024, 12, 1), date(2025, 2, 1)) == [
+        date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+    assert occurrence_dates(daily, date(2025, 1, 4), date(2025, 2, 1)) == []
+
+
+def test_exceptions_override_generated_occurrences(app):
+    rule_id = add_rule(app, frequency='daily', start_date=date(2025, 1, 1))
+    with app.app_context():
+        set_exception(rule_id, date(2025, 1, 2), completed=True)
+        set_exception(rule_id, date(2025, 1, 3), skipped=True)
+        set_exception(rule_id, date(2025, 1, 4), skipped=True)
+        set_exception(rule_id, date(2025, 1, 4), skipped=False)  # un-skipping updates the stored exception
+        db.session.commit()
+
+        occurrences = expand_occurrences(date(2025, 1, 1), date(2025, 1, 5))
+        assert [(o.date.day, o.completed) for o in occurrences] == [(1, False), (2, True), (4, False)]
+        pending = expand_occurrences(date(2025, 1, 1), date(2025, 1, 5), include_completed=False)
+        assert [o.date.day for o in pending] == [1, 4]
+
+
+def test_pages_merge_occurrences_for_their_range(app, client):
+    today = datetime.today().date()
+    add_rule(app, frequency='daily', start_date=today - timedelta(days=3), description='Stretch')
+    add_rule(app, frequency='monthly', start_date=date(2000, 1, 1), description='Pay rent')
+    with app.app_context():
+        db.session.add(Task(description='One-off', date=today, completed=False))
+        db.session.add(Task(description='Dentist', date=date(2025, 3, 5), completed=False))
+        db.session.commit()
+
+    home = client.get('/').get_data(as_text=True)
+    assert 'Stretch' in home and 'One-off' in home
+
+    task_manager = client.get('/task_manager?filter=today').get_data(as_text=True)
+    assert 'Stretch' in task_manager and 'One-off' in task_manager
+
+    start, end = date(2025, 3, 1), date(2025, 4, 1)
+    events = client.get(f'/api/calendar/events?start={start}T00:00:00Z&end={end}').get_json()
+    assert [(event['id'], event['title']) for event in events] == [(2, 'Dentist'), ('r2-2025-03-01', 'Pay rent')]
@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from wellness.extensions import db
+from wellness.models import Task
+
+
+def add_tasks(app, *descriptions):
+    with app.app_context():
+        tasks = [Task(description=description, date=date(2025, 1, 1), completed=False) for description in descriptions]
+        db.session.add_all(tasks)
+        db.session.commit()
+        return [task.id for task in tasks]
+
+
+def stored_tasks(app):
+    with app.app_context():
+        return {task.description: bool(task.completed) for task in Task.query}
+
+
+def post_batch(client, *operations):
+    return client.post('/api/tasks/batch', json={'operations': list(operations)})
+
+
+def test_mixed_batch_in_one_request(app, client):
+    read, write = add_tasks(app, 'Read', 'Write')
+    response = post_batch(
+        client,
+        {'op': 'create', 'description': '  Run  ', 'date': '2025-02-01'},
+        {'op': 'complete', 'id': read},
+        {'op': 'delete', 'id': write},
+        {'op': 'delete', 'id': 999},
+    )
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert results[0]['status'] == 'created'
+    assert results[0]['task'] == {'id': results[0]['id'], 'description': 'Run', 'date': '2025-02-01',
+                                  'completed': False}
+    assert results[1:] == [
+        {'op': 'complete', 'status': 'completed', 'id': read},
+        {'op': 'delete', 'status': 'deleted', 'id': write},
+        {'op': 'delete', 'status': 'not_found', 'id': 999},
+    ]
+    assert stored_tasks(app) == {'Read': True, 'Run': False}
+
+
+def test_invalid_items_get_their_own_error(app, client):
+    results = post_batch(
+        client,
+        {'op': 'rename', 'id': 1},
+        {'op': 'create', 'date': '2025-02-01'},
+        {'op': 'create', 'description': 'Run', 'date': 'soon'},
+        {'op': 'complete', 'id': '1'},
+        'delete 1',
+        {'op': 'create', 'description': 'Swim', 'date': '2025-02-01'},
+    ).get_json()['results']
+    assert [(result['op'], result['status']) for result in results] == [
+        ('rename', 'error'), ('create', 'error'), ('create', 'error'), ('complete', 'error'), (None, 'error'),
+        ('create', 'created')]
+    assert [result.get('error') for result in results[:5]] == [
+        'op must be create, complete or delete', 'description is required', 'date must be YYYY-MM-DD',
+        'id must be an integer', 'operation must be an object']
+    assert stored_tasks(app) == {'Swim': False}
+
+
+def test_malformed_body_is_rejected(client):
+    response = client.post('/api/tasks/batch', json={'operations': {'op': 'create'}})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Expected a JSON list of operations'}
+
+
+def test_batch_rolls_back_as_one_transaction(app, client):
+    read, write = add_tasks(app, 'Read', 'Write')
+    with app.app_context():
+        db.session.execute(db.text(
+            "CREATE TRIGGER no_deletes BEFORE DELETE ON task BEGIN SELECT RAISE(ABORT, 'deletes disabled'); END"))
+        db.session.commit()
+
+    # The delete statement runs last; when it fails the create and complete before it are undone too
+    with pytest.raises(IntegrityError):
+        post_batch(
+            client,
+            {'op': 'create', 'description': 'Run', 'date': '2025-02-01'},
+            {'op': 'complete', 'id': read},
+            {'op': 'delete', 'id': write},
+        )
+    assert stored_tasks(app) == {'Read': False, 'Write': False}
@@ -0,0 +1,71 @@
+import io
+
+from wellness.extensions import db
+from wellness.models import Expense, ExpenseCategory, WaterLog
+
+HEADER = b'description,amount,timestamp,category\n'
+
+
+def post_csv(client, kind, body, **args):
+    return client.post(f'/api/import/{kind}', query_string={'format': 'csv', **args}, data=body,
+                       content_type='text/csv')
+
+
+def expense_count(app):
+    with app.app_context():
+        return db.session.query(Expense).count()
+
+
+def test_import_valid_rows(app, client):
+    with app.app_context():
+        db.session.add(ExpenseCategory(name='Food', color='#123456'))
+        db.session.commit()
+    body = HEADER + b'Lunch,12.50,2025-03-01T12:00:00,food\n"Coffee, large",3,2025-03-02,\n'
+    response = post_csv(client, 'expenses', body)
+    assert response.status_code == 200
+    assert response.get_json() == {'imported': 2, 'failed': 0, 'errors': [], 'stopped_at': None}
+    with app.app_context():
+        descriptions = {e.description: e.category_id for e in Expense.query}
+    assert descriptions == {'Lunch': 1, 'Coffee, large': None}
+
+
+def test_bad_rows_reported_by_line(app, client):
+    body = HEADER + b'ok,1,2025-03-01,\nnan,nan,2025-03-01,\ninf,inf,2025-03-01,\nbig,1e308,2025-03-01,\nno date,1,,\n'
+    result = post_csv(client, 'expenses', body).get_json()
+    assert result['imported'] == 1
+    assert [error['line'] for error in result['errors']] == [3, 4, 5, 6]
+    assert 'finite' in result['errors'][0]['error'] and 'at most' in result['errors'][2]['error']
+    assert expense_count(app) == 1
+
+
+def test_dry_run_writes_nothing(app, client):
+    result = post_csv(client, 'expenses', HEADER + b'a,1,2025-03-01,\nb,2,2025-03-02,\n', dry_run='1').get_json()
+    assert result['imported'] == 2
+    assert expense_count(app) == 0
+
+
+def test_bad_encoding_stops_at_its_line(app, client):
+    body = HEADER + b'a,1,2025-03-01,\ncaf\xe9,2,2025-03-02,\nc,3,2025-03-03,\n'
+    response = post_csv(client, 'expenses', body)
+    assert response.status_code == 400
+    result = response.get_json()
+    assert result['stopped_at'] == 3 and result['errors'][0]['line'] == 3
+    assert 'UTF-8' in result['errors'][0]['error']
+    assert result['imported'] == expense_count(app) == 1
+
+
+def test_broken_csv_quoting_is_a_400(client):
+    response = post_csv(client, 'expenses', HEADER + b'a,1,2025-03-01,\n"b"x,2,2025-03-02,\n')
+    assert response.status_code == 400
+    error = response.get_json()['errors'][0]
+    assert error['line'] == 3 and 'malformed CSV' in error['error']
+
+
+def test_json_lines_skip_undecodable_lines(app, client):
+    body = b'{"amount": 250, "timestamp": "2025-03-01T08:00"}\n\xff\xfe\n{"amount": 500, "timestamp": "2025-03-01T09:00"}\n'
+    response = client.post('/api/import/water', data={'file': (io.BytesIO(body), 'water.jsonl')})
+    result = response.get_json()
+    assert response.status_code == 200
+    assert result['imported'] == 2 and [error['line'] for error in result['errors']] == [2]
+    with app.app_context():
+        assert db.session.query(WaterLog).count() == 2
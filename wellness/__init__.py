@@ -0,0 +1,73 @@
+"""Productivity & wellness tracker.
+
+`create_app()` builds the Flask app: one blueprint per subsystem (tasks,
+expenses, water, nutrition, affirmations, workouts) plus the dashboard, the
+chart data API and bulk import/export.
+Nothing touches the database, the network or the scheduler until the app
+is created and a request or CLI command needs it.
+"""
+import os
+import time
+
+from flask import Flask
+
+from .config import Config, basedir, instancedir
+from .database import engine_options, init_sqlite_pragmas
+from .extensions import (affirmations_api, api_ninjas, db, job_runner, migrate, request_metrics, response_cache,
+                         static_assets)
+
+
+def create_app(config=None):
+    """Create the app from Config, overridden by `config` (a dict or a config class) when given."""
+    app = Flask(
+        __name__,
+        template_folder=os.path.join(basedir, 'templates'),
+        static_folder=os.path.join(basedir, 'static'),
+        instance_path=instancedir
+    )
+    app.config.from_object(Config)
+    if isinstance(config, dict):
+        app.config.update(config)
+    elif config is not None:
+        app.config.from_object(config)
+
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config['SQLALCHEMY_DATABASE_URI']))
+    db.init_app(app)
+    with app.app_context():
+        init_sqlite_pragmas(db.engine, app.config['SQLITE_PRAGMAS'])
+        request_metrics.watch_engine(db.engine)
+    migrate.init_app(app, db, directory=os.path.join(basedir, 'migrations'))
+    response_cache.init_app(app)
+    request_metrics.init_app(app)
+    static_assets.init_app(app)
+    job_runner.init_app(app)
+    api_ninjas.configure(app.config['API_NINJAS_URL'], headers={'X-Api-Key': app.config['API_NINJAS_KEY']})
+    affirmations_api.configure(app.config['AFFIRMATIONS_URL'])
+
+    from . import affirmations, charts, dashboard, expenses, nutrition, recurrence, tasks, transfer, water, workouts
+    for module in (dashboard, tasks, recurrence, expenses, water, nutrition, affirmations, workouts, charts, transfer):
+        app.register_blueprint(module.bp)
+
+    # Warming only helps when the cache is shared with the web workers
+    if app.config['RESPONSE_CACHE_BACKEND'] == 'filesystem':
+        job_runner.periodic('warm_response_cache', minutes=5)(dashboard.warm_response_cache)
+
+    @app.before_request
+    def start_job_runner():
+        # Every worker tries; only the one that takes the lock file runs the jobs
+        if app.config['JOB_RUNNER_AUTOSTART']:
+            job_runner.try_start()
+
+    @app.cli.command('run-jobs')
+    def run_jobs_command():
+        """Run the periodic jobs in the foreground (for a dedicated scheduler process)."""
+        if not job_runner.start():
+            raise SystemExit("Another process already runs the jobs")
+        print("Running periodic jobs, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            job_runner.shutdown()
+
+    return app
@@ -0,0 +1,93 @@
+import random
+import time
+
+import requests
+from flask import Blueprint, jsonify, redirect, render_template, request, url_for
+from sqlalchemy import func
+
+from .extensions import affirmations_api, db, response_cache
+from .models import Affirmation
+
+bp = Blueprint('affirmations', __name__)
+
+#------------------------------------------- Random affirmation sampling ---------------------------------------------#
+# The row count and id range are cached per process; inserts here clear them and the TTL picks up other workers' changes
+AFFIRMATION_COUNT_TTL = 60  # seconds
+_affirmation_count = None  # (expires_at, count, min_id, max_id)
+
+def invalidate_affirmation_count():
+    global _affirmation_count
+    _affirmation_count = None
+
+def _cached_affirmation_count():
+    """(count, min_id, max_id) of the affirmation table, from one aggregate at most every AFFIRMATION_COUNT_TTL."""
+    global _affirmation_count
+    if _affirmation_count is None or _affirmation_count[0] < time.monotonic():
+        count, min_id, max_id = db.session.query(
+            func.count(Affirmation.id), func.min(Affirmation.id), func.max(Affirmation.id)).one()
+        _affirmation_count = (time.monotonic() + AFFIRMATION_COUNT_TTL, count, min_id, max_id)
+    return _affirmation_count[1:]
+
+def _affirmation_from(first_id):
+    return db.session.query(Affirmation.message).filter(Affirmation.id >= first_id).order_by(
+        Affirmation.id).limit(1).scalar()
+
+def random_affirmation(default):
+    """Pick one affirmation by seeking to a random id: one primary key lookup whatever the table size.
+
+    Uniform while ids are dense (affirmations are only ever appended); a row after a gap left by deleted rows
+    is picked proportionally more often.
+    """
+    for _ in range(2):
+        count, min_id, max_id = _cached_affirmation_count()
+        if not count:
+            return default
+        message = _affirmation_from(random.randint(min_id, max_id))
+        if message is None:
+            # Past the last row (rows deleted since the range was cached): wrap around to the first
+            message = _affirmation_from(min_id)
+        if message is not None:
+            return message
+        # Every row was deleted since the range was cached: look again and retry once
+        invalidate_affirmation_count()
+    return default
+
+#------------------------------------------------Route for Affirmations-------------------------------------------------#
+@bp.route('/affirmations', methods=['GET', 'POST'])
+def affirmations():
+    if request.method == 'POST':
+        message = request.form.get('message')
+        if message:
+            new_affirmation = Affirmation(message=message)
+            db.session.add(new_affirmation)
+            db.session.commit()
+            invalidate_affirmation_count()
+            response_cache.invalidate('affirmations')
+            return redirect(url_for('affirmations.affirmations'))
+    all_affirmations = Affirmation.query.all()
+    return render_template('affirmations.html', affirmations=all_affirmations)
+
+
+#------------------------------------Route for Generating Affirmations(API included)--------------------------------------------#
+@bp.route('/generate_affirmation')
+def generate_affirmation():
+    try:
+        data = affirmations_api.get_json('/')
+    except requests.RequestException:
+        data = None
+    if isinstance(data, dict):
+        message = data.get('affirmation')
+        if message:
+            new_affirmation = Affirmation(message=message)
+            db.session.add(new_affirmation)
+            db.session.commit()
+            invalidate_affirmation_count()
+            response_cache.invalidate('affirmations')
+            return redirect(url_for('affirmations.affirmations'))
+    return "Failed to generate affirmation", 500
+
+#------------------------------Route for Generating Randomn Affirmations---------------------------------------#
+@bp.route('/get_affirmation')
+@response_cache.cached('affirmations', ttl=5)
+def get_affirmation():
+    return jsonify({'affirmation': random_affirmation("Stay positive and keep going!")})
@@ -0,0 +1,153 @@
+"""Shared client for the external APIs (api-ninjas exercises, affirmations.dev).
+
+Every call goes through one pooled `requests.Session` with strict timeouts,
+retries with exponential backoff, and a circuit breaker. After repeated
+failures the circuit breaker stops calling a dead upstream for a while, so
+request threads don't pile up waiting on it.
+"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of calling the upstream while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and lets one trial call through after `reset_timeout`.
+
+    While the trial call is in flight every other caller is still turned away; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            if self.probe_started_at is not None:
+                # A probe that never reported back (e.g. its thread died) doesn't keep the circuit half-open forever
+                if now - self.probe_started_at < self.reset_timeout:
+                    return False
+            elif self.opened_at is None:
+                return True
+            elif now - self.opened_at < self.reset_timeout:
+                return False
+            # Half-open: this call is the single probe
+            self.probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probe_started_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self.probe_started_at = None
+
+
+class ApiClient:
+    """JSON GET client for one upstream base URL.
+
+    The base URL can be given later with `configure()`, so clients can be created before the app config is loaded.
+    """
+
+    def __init__(self, base_url='', headers=None, timeout=(3.05, 5), retries=2, backoff=0.3,
+                 failure_threshold=5, reset_timeout=30, pool_size=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def configure(self, base_url, headers=None):
+        self.base_url = base_url.rstrip('/')
+        self.session.headers.update(headers or {})
+
+    def get_json(self, path='/', params=None):
+        """GET base_url + path and return the decoded JSON. Raises requests.RequestException on any failure."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.base_url} is unavailable, skipping call")
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except requests.RequestException:  # includes requests.JSONDecodeError for a bad body
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return data
+
+
+class ExerciseCache:
+    """Exercise lists from api-ninjas keyed by muscle group.
+
+    A fresh entry is served from memory. A stale entry is still served, and a
+    background thread refreshes it. Only a muscle that has never been fetched
+    waits on the upstream.
+    """
+
+    def __init__(self, client, ttl=6 * 3600):
+        self.client = client
+        self.ttl = ttl
+        self._entries = {}  # muscle -> (fetched_at, exercises)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def fetch(self, muscle):
+        exercises = self.client.get_json('/exercises', params={'muscle': muscle})
+        with self._lock:
+            self._entries[muscle] = (time.monotonic(), exercises)
+        return exercises
+
+    def get(self, muscle):
+        """Return the cached exercises for a muscle group, fetching them if never seen."""
+        with self._lock:
+            entry = self._entries.get(muscle)
+        if entry is None:
+            return self.fetch(muscle)
+        fetched_at, exercises = entry
+        if time.monotonic() - fetched_at > self.ttl:
+            self._refresh_in_background(muscle)
+        return exercises
+
+    def _refresh_in_background(self, muscle):
+        with self._lock:
+            if muscle in self._refreshing:
+                return
+            self._refreshing.add(muscle)
+
+        def refresh():
+            try:
+                self.fetch(muscle)
+            except requests.RequestException:
+                pass  # keep serving the stale list; the next stale read retries
+            finally:
+                with self._lock:
+                    self._refreshing.discard(muscle)
+
+        threading.Thread(target=refresh, daemon=True).start()
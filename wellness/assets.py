@@ -0,0 +1,423 @@
+"""Static asset build and serving: fingerprinted, minified, pre-compressed files with long-lived caching.
+
+`flask build-assets` writes every file under static/ to static/dist/ with a
+content hash in its name (style.css -> dist/style.1a2b3c4d5e.css). CSS and
+JS are minified, and each compressible file gets .gz (and, when the brotli
+package is installed, .br) siblings. With Pillow installed, JPEG/PNG images
+also get WebP and AVIF copies at several widths. dist/manifest.json maps
+source names to built names.
+
+At runtime url_for('static', filename='style.css') resolves through the
+manifest. Built files are served with `Cache-Control: immutable`, in the
+best pre-compressed encoding the browser accepts. Without a build, or for a
+source edited since the last one, the plain file is served as before.
+
+Third-party libraries live in static/vendor/. VENDOR lists pinned files
+that `flask build-assets --fetch-vendor` downloads. The build fails while
+any of them is missing, so a built app never loads code from a CDN; only an
+unbuilt checkout falls back to the CDN through vendor_url().
+"""
+import gzip
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+import time
+
+import click
+from flask import current_app, request, send_from_directory, url_for
+from flask.cli import with_appcontext
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:  # optional: JS is only stripped of comments and indentation
+    rjsmin = None
+
+BUILD_DIR = 'dist'
+MANIFEST = 'manifest.json'
+ONE_YEAR = 365 * 24 * 3600
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.ttf', '.txt')
+IMAGE_WIDTHS = (640, 1280, 1920)
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+# Pinned third-party files: path under static/ -> CDN URL, used until the file is fetched
+VENDOR = {
+    'vendor/fullcalendar-5.11.3/main.min.js': 'https://cdn.jsdelivr.net/npm/fullcalendar@5.11.3/main.min.js',
+    'vendor/fullcalendar-5.11.3/main.min.css': 'https://cdn.jsdelivr.net/npm/fullcalendar@5.11.3/main.min.css',
+}
+
+#---------------------------------------------------- Minification ---------------------------------------------------#
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMMENTS = re.compile(r'(/\*.*?\*/)|(' + _CSS_STRING + ')', re.DOTALL)
+_CSS_STRINGS = re.compile('(' + _CSS_STRING + ')')
+
+def minify_css(text):
+    """Drop comments (except /*! licence */ ones) and collapse whitespace; strings are left alone."""
+    # Comments first, since a comment may contain quotes and a string may contain "/*"
+    text = _CSS_COMMENTS.sub(lambda m: m.group(0) if m.group(2) or m.group(1).startswith('/*!') else '', text)
+    parts = _CSS_STRINGS.split(text)  # strings at the odd indexes
+    return ''.join(part if i % 2 else _squeeze_css(part) for i, part in enumerate(parts)).strip()
+
+def _squeeze_css(chunk):
+    chunk = re.sub(r'\s+', ' ', chunk)
+    chunk = re.sub(r'\s*([{};,>])\s*', r'\1', chunk)
+    # A space after a colon never matters (selectors can't have one), a space before one can ("a :hover")
+    return re.sub(r':\s+', ':', chunk).replace(';}', '}')
+
+_JS_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')  # a "/" after one of these (or a keyword) starts a regex literal
+_JS_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do',
+                      'else', 'yield', 'await'}
+
+def minify_js(text):
+    """Minify with rjsmin when it is installed, else strip comments, indentation and blank lines.
+
+    The fallback never renames or joins lines; strings, regex literals and template literals (including
+    nested ${...} expressions) are copied verbatim. /*! licence */ comments are kept either way.
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(text, keep_bang_comments=True) + '\n'
+    return _strip_js(text)
+
+def _strip_js(text):
+    text = text.replace('\r\n', '\n')
+    out = []
+    braces = []  # one entry per open ${...}: how many { } are nested inside it
+    i, n = 0, len(text)
+    while i < n:
+        ch, pair = text[i], text[i:i + 2]
+        if ch == '\n':
+            _end_js_line(out)
+            i += 1
+        elif ch in ' \t':
+            if out and not out[-1].endswith('\n'):
+                out.append(ch)
+            i += 1
+        elif pair == '//':
+            end = text.find('\n', i)
+            i = n if end == -1 else end
+        elif pair == '/*':
+            end = text.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            comment = text[i:end]
+            if comment.startswith('/*!'):
+                out.append(comment)
+            elif '\n' in comment:
+                _end_js_line(out)
+            elif out and not out[-1].endswith('\n'):
+                out.append(' ')  # keeps the tokens on either side apart
+            i = end
+        elif ch in '\'"':
+            end = _js_literal_end(text, i, ch)
+            out.append(text[i:end])
+            i = end
+        elif ch == '/' and _js_regex_allowed(out):
+            end = _js_literal_end(text, i, '/')
+            out.append(text[i:end])
+            i = end
+        elif ch == '`' or (ch == '}' and braces and braces[-1] == 0):
+            if ch == '}':
+                braces.pop()
+            i, closed = _js_template_text(text, i, out)
+            if not closed:
+                braces.append(0)
+        else:
+            if braces and ch in '{}':
+                braces[-1] += 1 if ch == '{' else -1
+            out.append(ch)
+            i += 1
+    return ''.join(out).rstrip() + '\n'
+
+def _end_js_line(out):
+    """End the current output line without trailing whitespace, unless it is empty."""
+    while out and out[-1] in (' ', '\t'):
+        out.pop()
+    if out and not out[-1].endswith('\n'):
+        out.append('\n')
+
+def _js_literal_end(text, start, quote):
+    """Index just past the string or regex literal opening at `start` (it can't span lines)."""
+    i, in_class = start + 1, False
+    while i < len(text) and text[i] != '\n':
+        ch = text[i]
+        if ch == '\\':
+            i += 2
+            continue
+        i += 1
+        if quote == '/' and ch in '[]':
+            in_class = ch == '['
+        elif ch == quote and not in_class:
+            break
+    return i
+
+def _js_regex_allowed(out):
+    tail = ''.join(out[-12:]).rstrip()
+    word = re.search(r'[\w$]+$', tail)
+    return not tail or tail[-1] in _JS_REGEX_AFTER or (word is not None and word.group() in _JS_REGEX_KEYWORDS)
+
+def _js_template_text(text, start, out):
+    """Copy template literal text from the ` or } at `start` up to its closing ` or next ${.
+
+    Returns (index after it, whether the literal closed).
+    """
+    out.append(text[start])
+    i = start + 1
+    while i < len(text):
+        if text[i] == '\\':
+            out.append(text[i:i + 2])
+            i += 2
+        elif text[i] == '`':
+            out.append('`')
+            return i + 1, True
+        elif text.startswith('${', i):
+            out.append('${')
+            return i + 2, False
+        else:
+            out.append(text[i])
+            i += 1
+    return i, True
+
+#-------------------------------------------------------- Build -------------------------------------------------------#
+
+def fingerprinted_name(name, data):
+    stem, ext = posixpath.splitext(name)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+
+def _write(out_root, name, data):
+    path = os.path.join(out_root, *name.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _write_built(out_root, name, data, encodings):
+    """Write data under its fingerprinted name plus compressed siblings; returns the path relative to static/."""
+    built = fingerprinted_name(name, data)
+    _write(out_root, built, data)
+    if built.endswith(COMPRESSIBLE):
+        available = []
+        compressed = [('gzip', '.gz', gzip.compress(data, 9, mtime=0))]
+        if brotli is not None:
+            compressed.insert(0, ('br', '.br', brotli.compress(data, quality=11)))
+        for encoding, suffix, body in compressed:
+            if len(body) < len(data) * 0.9:
+                _write(out_root, built + suffix, body)
+                available.append(encoding)
+        if available:
+            encodings[f'{BUILD_DIR}/{built}'] = available
+    return f'{BUILD_DIR}/{built}'
+
+def _rewrite_css_urls(text, name, files):
+    """Point relative url() references at the built files (dist/ mirrors the source layout)."""
+    def replace(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        target = files.get(posixpath.normpath(posixpath.join(posixpath.dirname(name), path)))
+        if target is None:
+            return match.group(0)
+        relative = posixpath.relpath(target, posixpath.dirname(f'{BUILD_DIR}/{name}'))
+        return f'url({quote}{relative}{suffix}{quote})'
+    return CSS_URL.sub(replace, text)
+
+def responsive_images(out_root, name, data, encodings):
+    """WebP and AVIF copies of an image at IMAGE_WIDTHS (never wider than the original), if Pillow is installed.
+
+    Returns {'webp': [[width, path], ...], 'avif': [...]}, leaving out formats this Pillow can't write.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return {}
+    image = Image.open(io.BytesIO(data))
+    image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    widths = sorted({min(width, image.width) for width in IMAGE_WIDTHS})
+    stem = posixpath.splitext(name)[0]
+    variants = {}
+    for fmt, options in (('webp', {'quality': 80, 'method': 6}), ('avif', {'quality': 50})):
+        for width in widths:
+            resized = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            buffer = io.BytesIO()
+            try:
+                resized.save(buffer, fmt.upper(), **options)
+            except (KeyError, OSError, ValueError):  # no encoder for this format
+                break
+            path = _write_built(out_root, f'{stem}-{width}w.{fmt}', buffer.getvalue(), encodings)
+            variants.setdefault(fmt, []).append([width, path])
+    return variants
+
+def build_assets(static_folder):
+    """Rebuild static/dist/ from every other file under static/ and return the manifest."""
+    out_root = os.path.join(static_folder, BUILD_DIR)
+    shutil.rmtree(out_root, ignore_errors=True)
+    sources = []
+    for directory, subdirs, filenames in os.walk(static_folder):
+        if directory == static_folder and BUILD_DIR in subdirs:
+            subdirs.remove(BUILD_DIR)
+        sources += [
+            os.path.relpath(os.path.join(directory, filename), static_folder).replace(os.sep, '/')
+            for filename in filenames
+        ]
+
+    files, images, encodings = {}, {}, {}
+    # CSS last, so its url() references can be pointed at the fingerprinted fonts and images
+    for name in sorted(sources, key=lambda name: (name.endswith('.css'), name)):
+        with open(os.path.join(static_folder, name), 'rb') as f:
+            data = f.read()
+        ext = posixpath.splitext(name)[1].lower()
+        if ext == '.css':
+            text = _rewrite_css_urls(data.decode('utf-8'), name, files)
+            data = (text if '.min.' in name else minify_css(text)).encode('utf-8')
+        elif ext == '.js' and '.min.' not in name:
+            data = minify_js(data.decode('utf-8')).encode('utf-8')
+        files[name] = _write_built(out_root, name, data, encodings)
+        if ext in ('.jpg', '.jpeg', '.png'):
+            variants = responsive_images(out_root, name, data, encodings)
+            if variants:
+                images[name] = variants
+
+    manifest = {'built': time.time(), 'files': files, 'images': images, 'encodings': encodings}
+    with open(os.path.join(out_root, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+def missing_vendor(static_folder):
+    return [name for name in VENDOR if not os.path.exists(os.path.join(static_folder, *name.split('/')))]
+
+def fetch_vendor(static_folder):
+    """Download the VENDOR files that aren't in static/ yet; returns the paths fetched."""
+    import requests
+    fetched = []
+    for name in missing_vendor(static_folder):
+        response = requests.get(VENDOR[name], timeout=30)
+        response.raise_for_status()
+        path = os.path.join(static_folder, *name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        fetched.append(name)
+    return fetched
+
+@click.command('build-assets')
+@click.option('--fetch-vendor', 'fetch', is_flag=True, help='Download missing VENDOR files from their CDN first.')
+@with_appcontext
+def build_assets_command(fetch):
+    """Fingerprint, minify and pre-compress static/ into static/dist/."""
+    static_folder = current_app.static_folder
+    if fetch:
+        try:
+            fetched = fetch_vendor(static_folder)
+        except OSError as e:  # requests' errors are OSErrors too
+            raise SystemExit(f"Could not fetch the vendor files: {e}")
+        for name in fetched:
+            print(f"fetched {name}")
+    missing = missing_vendor(static_folder)
+    if missing:
+        raise SystemExit("Missing pinned vendor files (run `flask build-assets --fetch-vendor`): " + ', '.join(missing))
+
+    manifest = build_assets(static_folder)
+    size = lambda name: os.path.getsize(os.path.join(static_folder, *name.split('/')))
+    for source, built in sorted(manifest['files'].items()):
+        encoded = ', '.join(
+            f"{encoding} {size(built + ('.br' if encoding == 'br' else '.gz')) / 1024:.1f} KB"
+            for encoding in manifest['encodings'].get(built, [])
+        )
+        print(f"{source:<56} {size(source) / 1024:>8.1f} KB -> {size(built) / 1024:>8.1f} KB"
+              + (f" ({encoded})" if encoded else ''))
+    for source, variants in sorted(manifest['images'].items()):
+        for fmt, sizes in variants.items():
+            print(f"{source:<56} {fmt}: " + ', '.join(f"{width}w {size(path) / 1024:.1f} KB" for width, path in sizes))
+    if brotli is None:
+        print("brotli is not installed: built gzip variants only")
+    print(f"Built {len(manifest['files'])} files into {os.path.join(static_folder, BUILD_DIR)}; restart the app to serve them")
+
+#------------------------------------------------------- Serving ------------------------------------------------------#
+
+def vendor_url(name):
+    """URL of a VENDOR file: the local copy, or its CDN in an unbuilt checkout where it hasn't been fetched."""
+    if os.path.exists(os.path.join(current_app.static_folder, *name.split('/'))):
+        return url_for('static', filename=name)
+    return VENDOR[name]
+
+
+class StaticAssets:
+    """Serves the built assets; see the module docstring."""
+
+    def __init__(self, app=None):
+        self.static_folder = None
+        self.files = {}      # source name -> built path (relative to static/)
+        self.images = {}     # source name -> {format: [[width, built path], ...]}
+        self.encodings = {}  # built path -> pre-compressed encodings available
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.static_folder = app.static_folder
+        self.load_manifest(app)
+        app.url_defaults(self._built_url)
+        app.view_functions['static'] = self.send_static
+        app.add_template_global(vendor_url)
+        app.add_template_global(self.srcset, 'asset_srcset')
+        app.cli.add_command(build_assets_command)
+        app.extensions['static_assets'] = self
+
+    def load_manifest(self, app):
+        try:
+            with open(os.path.join(self.static_folder, BUILD_DIR, MANIFEST)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            self.files, self.images, self.encodings = {}, {}, {}
+            return
+        # A source edited after the build is served as it is until the next build
+        stale = set()
+        for source in manifest['files']:
+            try:
+                if os.path.getmtime(os.path.join(self.static_folder, *source.split('/'))) > manifest['built']:
+                    stale.add(source)
+            except OSError:
+                stale.add(source)
+        if stale:
+            app.logger.warning("%d static file(s) changed since the last `flask build-assets`: %s",
+                               len(stale), ', '.join(sorted(stale)))
+        self.files = {source: built for source, built in manifest['files'].items() if source not in stale}
+        self.images = manifest.get('images', {})
+        self.encodings = manifest.get('encodings', {})
+
+    def _built_url(self, endpoint, values):
+        if endpoint == 'static' and values.get('filename') in self.files:
+            values['filename'] = self.files[values['filename']]
+
+    def srcset(self, name, fmt):
+        """`srcset` value listing the built widths of an image in one format ('' without a build)."""
+        sizes = self.images.get(name, {}).get(fmt, [])
+        return ', '.join(f"{url_for('static', filename=path)} {width}w" for width, path in sizes)
+
+    def send_static(self, filename):
+        if not filename.startswith(BUILD_DIR + '/'):
+            return current_app.send_static_file(filename)
+
+        # Built names change with their content, so they can be cached for good
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        available = self.encodings.get(filename, [])
+        for encoding in available:
+            if encoding in request.accept_encodings:
+                suffix = '.br' if encoding == 'br' else '.gz'
+                response = send_from_directory(self.static_folder, filename + suffix, mimetype=mimetype,
+                                               max_age=ONE_YEAR)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(self.static_folder, filename, mimetype=mimetype, max_age=ONE_YEAR)
+        if available:
+            response.vary.add('Accept-Encoding')
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
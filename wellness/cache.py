@@ -0,0 +1,221 @@
+"""Server-side response cache for the read-heavy pages.
+
+Views are cached per URL under one or more tags (e.g. 'tasks', 'expenses').
+Write routes call `invalidate(tag)`, which swaps the tag's generation token so
+every cached page built from that data is skipped and ages out of the backend.
+Streamed pages are passed through as they render and stored once complete,
+unless they grow past MAX_STREAMED_ENTRY bytes.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+import uuid
+
+from flask import Response, make_response, request, session
+
+MAX_STREAMED_ENTRY = 1024 * 1024  # bytes; bigger streamed pages (e.g. ?per_page=all) are never cached
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with per-entry TTL and a maximum number of entries."""
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] is not None and entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileSystemCache:
+    """Pickle-per-entry cache in a directory, shared by every worker process on the host."""
+
+    def __init__(self, directory, max_entries=500):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((expires_at, value), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+        self._prune()
+
+    def _prune(self):
+        names = [name for name in os.listdir(self.directory) if not name.endswith('.tmp')]
+        if len(names) <= self.max_entries:
+            return
+        paths = sorted((os.path.join(self.directory, name) for name in names), key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+class ResponseCache:
+    """Caches GET responses of decorated views and counts hits and misses.
+
+    Configured from the app config:
+      RESPONSE_CACHE_BACKEND      'memory' (default), 'filesystem' or 'null' to disable
+      RESPONSE_CACHE_DIR          directory for the filesystem backend
+      RESPONSE_CACHE_MAX_ENTRIES  size bound for either backend (default 500)
+      RESPONSE_CACHE_TTL          default time-to-live in seconds (default 60)
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.default_ttl = 60
+        self.hits = 0
+        self.misses = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        kind = app.config.get('RESPONSE_CACHE_BACKEND', 'memory')
+        max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 500)
+        self.default_ttl = app.config.get('RESPONSE_CACHE_TTL', 60)
+        if kind == 'memory':
+            self.backend = MemoryCache(max_entries)
+        elif kind == 'filesystem':
+            directory = app.config.get('RESPONSE_CACHE_DIR') or os.path.join(app.instance_path, 'cache')
+            self.backend = FileSystemCache(directory, max_entries)
+        elif kind == 'null':
+            self.backend = None
+        else:
+            raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {kind}")
+        app.extensions['response_cache'] = self
+
+    def _generation(self, tag):
+        key = f'tag:{tag}'
+        generation = self.backend.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(key, generation)
+        return generation
+
+    def invalidate(self, *tags):
+        """Drop every cached response built from the given tags."""
+        if self.backend is None:
+            return
+        for tag in tags:
+            self.backend.set(f'tag:{tag}', uuid.uuid4().hex)
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    @contextmanager
+    def disabled(self):
+        """Run every cached view uncached inside the block (e.g. to measure what a miss costs)."""
+        backend, self.backend = self.backend, None
+        try:
+            yield
+        finally:
+            self.backend = backend
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__ if self.backend else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0
+        }
+
+    def cached(self, *tags, ttl=None):
+        """Decorator caching a view's successful GET responses under the given tags."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                # Pages rendered with pending flash messages are per-user, so never cache them
+                if self.backend is None or request.method != 'GET' or '_flashes' in session:
+                    return view(*args, **kwargs)
+
+                generations = ':'.join(self._generation(tag) for tag in tags)
+                key = f'view:{request.full_path}:{generations}'
+                entry = self.backend.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    body, status, headers = entry
+                    response = Response(body, status=status, headers=headers)
+                    return response.make_conditional(request) if 'ETag' in response.headers else response
+
+                self.misses += 1
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    headers = [(name, value) for name, value in response.headers if name != 'Set-Cookie']
+                    if response.is_streamed:
+                        response.response = self._store_streamed(key, response.response, headers,
+                                                                 ttl or self.default_ttl)
+                    else:
+                        self.backend.set(key, (response.get_data(), 200, headers), ttl or self.default_ttl)
+                return response
+            return wrapper
+        return decorator
+
+    def _store_streamed(self, key, chunks, headers, ttl):
+        """Yield a streamed body unchanged, caching it at the end if it finished and stayed small enough."""
+        parts, size = [], 0
+        for chunk in chunks:
+            yield chunk
+            if parts is None:
+                continue
+            data = chunk.encode() if isinstance(chunk, str) else chunk
+            size += len(data)
+            if size > MAX_STREAMED_ENTRY:
+                parts = None
+            else:
+                parts.append(data)
+        if parts is not None:
+            self.backend.set(key, (b''.join(parts), 200, headers), ttl)
@@ -0,0 +1,89 @@
+"""Chart data for the report pages, served as compact columnar JSON.
+
+GET /api/charts/<name> returns one chart's series as parallel arrays
+(e.g. {"labels": [...], "values": [...]}), read from the same aggregate
+queries and rollups the pages use. Charts drawn from one query share a
+payload keyed by series (see task-summary). Pages render without their charts and
+fetch them after load; trace styling and titles live in static/script.js.
+Responses carry an ETag, so a chart that hasn't changed revalidates with a 304.
+"""
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, request
+
+from .expenses import expense_totals_by_category, monthly_expense_trend
+from .extensions import db
+from .helpers import recent_month_starts
+from .models import ExpenseCategory
+from .tasks import TREND_RANGES, TaskStats
+from .water import water_history
+
+bp = Blueprint('charts', __name__)
+
+EXPENSE_TREND_MONTHS = 6
+
+#-------------------------------------------- Chart builders (one per chart) -----------------------------------------#
+
+def task_summary_chart(today):
+    """Both summary charts of the productivity report, from one TaskStats.summary() aggregate."""
+    stats = TaskStats(today).summary()
+    current_app.logger.debug("Task stats: %s", stats)
+    return {
+        'task-status': {'labels': ['Completed', 'Pending'], 'values': [stats['completed'], stats['pending']]},
+        'tasks-completed': {
+            'labels': ['Today', 'This Week', 'This Month'],
+            'values': [stats['daily_completed'], stats['weekly_completed'], stats['monthly_completed']]
+        }
+    }
+
+def task_trend_chart(today):
+    days = request.args.get('days', 30, type=int)
+    if days not in TREND_RANGES:
+        days = 30
+    trend = TaskStats(today).daily_completions(days)
+    return {'days': days, 'x': [day.isoformat() for day, _ in trend], 'y': [count for _, count in trend]}
+
+def expense_categories_chart(today):
+    """This month's spending per category, from the rollup table."""
+    totals = expense_totals_by_category(today)
+    categories = db.session.query(ExpenseCategory.id, ExpenseCategory.name, ExpenseCategory.color).order_by(
+        ExpenseCategory.id).all()
+    return {
+        'labels': [name for _, name, _ in categories],
+        'values': [round(totals.get(category_id, 0), 2) for category_id, _, _ in categories],
+        'colors': [color for _, _, color in categories]
+    }
+
+def expense_trend_chart(today):
+    months = monthly_expense_trend(recent_month_starts(today, EXPENSE_TREND_MONTHS))
+    return {'x': [month['date'] for month in months], 'y': [round(month['total'], 2) for month in months]}
+
+def water_history_chart(today):
+    rows = water_history(today)
+    return {
+        'x': [row.day.strftime('%b %d') for row in rows],
+        'total': [row.total for row in rows],
+        'target': [row.target for row in rows]
+    }
+
+CHARTS = {
+    'task-summary': task_summary_chart,
+    'task-trend': task_trend_chart,
+    'expense-categories': expense_categories_chart,
+    'expense-trend': expense_trend_chart,
+    'water-history': water_history_chart,
+}
+
+#-------------------------------------------------Route serving chart data---------------------------------------------#
+@bp.route('/api/charts/<name>')
+def chart_data(name):
+    build = CHARTS.get(name)
+    if build is None:
+        return jsonify({'error': f"Unknown chart {name!r}"}), 404
+
+    response = jsonify(build(datetime.today().date()))
+    # Always revalidate (the data changes with every write) but let an unchanged chart come back as a 304
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
@@ -0,0 +1,48 @@
+import os
+import sys
+
+# Project root: templates/, static/ and migrations/ live next to the wellness package
+basedir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# A frozen (PyInstaller) build unpacks into a temporary folder, so keep its database next to the executable
+if getattr(sys, 'frozen', False):
+    instancedir = os.path.join(os.path.dirname(sys.executable), 'instance')
+else:
+    instancedir = os.path.join(basedir, 'instance')
+
+
+class Config:
+    """Default settings. Pass a dict or another class to create_app() to override them."""
+
+    SECRET_KEY = 'your-secret-key-here'
+
+    # SQLite database in the "instance" folder, or a server database from DATABASE_URL
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f'sqlite:///{os.path.join(instancedir, "app.db")}'
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLALCHEMY_ENGINE_OPTIONS defaults to a pool suited to the URL (see database.py)
+
+    # Applied to every SQLite connection; set to {} for SQLite's defaults
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',          # readers don't block the writer and vice versa
+        'synchronous': 'NORMAL',        # safe with WAL; fsync at checkpoints instead of every commit
+        'busy_timeout': 5000,           # ms to wait for a lock before "database is locked"
+        'cache_size': -20000,           # negative means KiB: ~20 MB page cache per connection
+        'mmap_size': 128 * 1024 * 1024, # read pages through a memory map instead of read() calls
+    }
+
+    # Response cache: 'memory' (per process), 'filesystem' (shared by workers) or 'null' (disabled)
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')
+    RESPONSE_CACHE_TTL = 60  # seconds
+
+    # Request/SQL metrics for /metrics; statements slower than SLOW_QUERY_MS are logged (unset = no slow-query log)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'
+    SLOW_QUERY_MS = int(os.environ['SLOW_QUERY_MS']) if os.environ.get('SLOW_QUERY_MS') else None
+
+    # Periodic jobs start with the first request (set JOB_RUNNER_AUTOSTART=0 when running `flask run-jobs` separately)
+    JOB_RUNNER_AUTOSTART = os.environ.get('JOB_RUNNER_AUTOSTART', '1') == '1'
+
+    # External APIs (base URLs can point at a local stub server)
+    # API Key for API Ninjas service. Server might be down by the time code is submitted
+    API_NINJAS_KEY = 'jwxOJEhMmeMBb65wq4Jj7Q==JFoavdqAGgs2zmah'
+    API_NINJAS_URL = os.environ.get('API_NINJAS_URL', 'https://api.api-ninjas.com/v1')
+    AFFIRMATIONS_URL = os.environ.get('AFFIRMATIONS_URL', 'https://www.affirmations.dev')
@@ -0,0 +1,169 @@
+import random
+from datetime import datetime
+
+from flask import Blueprint, Response, current_app, jsonify, render_template
+
+from .affirmations import random_affirmation
+from .extensions import db, job_runner, request_metrics, response_cache
+from .helpers import day_range
+from .models import Task
+from .recurrence import expand_occurrences
+from .workouts import random_exercise
+
+bp = Blueprint('dashboard', __name__, cli_group=None)
+
+#------------------------------------------------- Define Routes-----------------------------------------------------#
+
+@bp.route('/')
+@response_cache.cached('tasks', 'affirmations')
+def home(): #Route to display tasks and random affirmations on dashboard#
+
+    today = datetime.today().date()
+    tasks = Task.query.filter(Task.date == today).all() + expand_occurrences(*day_range(today))
+    daily_affirmation = random_affirmation("Stay positive!")
+
+    return render_template('dashboard.html', tasks=tasks, affirmation=daily_affirmation)
+
+#------------------------------Route exposing response cache hit/miss counters------------------------------------------#
+@bp.route('/api/cache/stats')
+def cache_stats():
+    return jsonify(response_cache.stats())
+
+#------------------------------Route exposing request and SQL metrics to Prometheus---------------------------------------#
+@bp.route('/metrics')
+def metrics():
+    cache = response_cache.stats()
+    extra = [
+        ('wellness_response_cache_hits_total', 'counter', 'Response cache hits.', cache['hits']),
+        ('wellness_response_cache_misses_total', 'counter', 'Response cache misses.', cache['misses']),
+    ]
+    return Response(request_metrics.render(extra), mimetype='text/plain; version=0.0.4')
+
+#-----------------------------------CLI command to check each page's SQL query budget-------------------------------#
+# Most statements each page may run on a cache miss; a new N+1 loop shows up here first
+QUERY_BUDGETS = {
+    '/': 5,
+    '/task_manager': 4,
+    '/calendar': 0,
+    '/api/calendar/events?start=2025-01-01&end=2025-02-01': 3,
+    '/productivity_report': 0,
+    '/api/charts/task-summary': 1,
+    '/api/charts/task-trend': 1,
+    '/api/charts/expense-categories': 2,
+    '/api/charts/expense-trend': 1,
+    '/api/charts/water-history': 1,
+    '/expenses': 6,
+    '/water_intake': 2,
+    '/nutrition': 2,
+    '/affirmations': 1,
+    '/api/tasks': 1,
+    '/api/expenses': 2,
+}
+
+@bp.cli.command('check-query-budgets')
+def check_query_budgets():
+    """Fail if any page runs more SQL statements than its budget in QUERY_BUDGETS."""
+    failures = 0
+    current_app.config['JOB_RUNNER_AUTOSTART'] = False
+    with response_cache.disabled(), current_app.test_client() as client:
+        for path, budget in QUERY_BUDGETS.items():
+            try:
+                with request_metrics.assert_max_queries(budget) as queries:
+                    response = client.get(path)
+                    response.get_data()  # streamed pages run their queries as the body is read
+                    status = response.status_code
+            except AssertionError as e:
+                failures += 1
+                print(f"OVER {path:<28} {e}")
+                continue
+            print(f"ok   {path:<28} {len(queries)}/{budget} queries (HTTP {status})")
+    if failures:
+        raise SystemExit(f"{failures} page(s) over their query budget")
+
+#-----------------------------------CLI command to check hot queries use an index-----------------------------------#
+# Every budgeted page, plus the filters and cursors that change the SQL a page runs
+INDEX_CHECK_PATHS = (
+    *QUERY_BUDGETS,
+    '/task_manager?filter=today',
+    '/task_manager?filter=week&after=2025-01-01,1',
+    '/task_manager?filter=month',
+    '/api/tasks?filter=week&after=2025-01-01,1',
+    '/expenses?category_filter=1&time_filter=month',
+    '/expenses?time_filter=week&after=2025-01-01T00:00:00,1',
+    '/api/expenses?category_filter=1&after=2025-01-01T00:00:00,1',
+)
+
+def hot_queries():
+    """The SELECTs the pages in INDEX_CHECK_PATHS (and the workout picker) run, as (source, statement, parameters).
+
+    Statements are captured from the engine while the real views handle each request, so the list can't drift
+    from the code. Each distinct statement is listed once.
+    """
+    current_app.config['JOB_RUNNER_AUTOSTART'] = False
+    captured = []
+    with response_cache.disabled(), current_app.test_client() as client:
+        for path in INDEX_CHECK_PATHS:
+            with request_metrics.record_queries() as queries:
+                client.get(path).get_data()  # streamed pages run their queries as the body is read
+            captured += [(path, query) for query in queries]
+    with request_metrics.record_queries() as queries:
+        random_exercise(muscle='chest', difficulty='beginner')  # POST-only view; its query comes from this helper
+    captured += [('random_exercise', query) for query in queries]
+
+    seen = set()
+    statements = []
+    for source, query in captured:
+        if query.statement.lstrip().upper().startswith('SELECT') and query.statement not in seen:
+            seen.add(query.statement)
+            statements.append((source, query.statement, query.parameters))
+    return statements
+
+# Full scans that are intended, by (page, plan step), with why
+EXPECTED_SCANS = {
+    ('/', 'SCAN affirmation'): "COUNT for the cached affirmation count and id range the random pick seeks into",
+    ('/affirmations', 'SCAN affirmation'): "the page lists every affirmation",
+    ('/expenses', 'SCAN expense_category'): "small lookup table, listed whole",
+    ('/api/charts/expense-categories', 'SCAN expense_category'): "small lookup table, listed whole",
+    ('/expenses', 'SCAN expense'): "all-time total when no time filter is set",
+}
+
+def explain_query_plan(statement, parameters=()):
+    """Return the SQLite query plan steps for a statement."""
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+    return [row[-1] for row in rows]
+
+@bp.cli.command('check-indexes')
+def check_indexes():
+    """Fail if any hot route query falls back to an unexpected full table scan or a sort.
+
+    Run it against a database with some data: a branch a page skips on empty tables (e.g. the random picks) isn't seen.
+    """
+    failures = 0
+    for source, statement, parameters in hot_queries():
+        print(f"     {source}: {' '.join(statement.split())}")
+        for step in explain_query_plan(statement, parameters):
+            expected = EXPECTED_SCANS.get((source.partition('?')[0], step))
+            full_scan = (step.startswith('SCAN') and 'INDEX' not in step and step != 'SCAN CONSTANT ROW'
+                         or 'TEMP B-TREE' in step)
+            if full_scan and not expected:
+                failures += 1
+            print(f"{'SCAN' if full_scan and not expected else 'ok  '}   {step}{f'  ({expected})' if expected else ''}")
+    if failures:
+        raise SystemExit(f"{failures} query step(s) without an index")
+
+#--------------------------------------- Background jobs (reminders and maintenance)-----------------------------------#
+@job_runner.periodic('send_reminder', minutes=1)  # Change interval as needed
+def send_reminder():
+    messages = [
+        "Stay hydrated! Drink a glass of water.",
+        "Time to stretch! Take a quick break.",
+        "Take a deep breath. You’re doing amazing!"
+    ]
+    reminder = random.choice(messages)
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {reminder}")
+
+def warm_response_cache():
+    """Render the cached dashboards so the first visit after an invalidation is a hit."""
+    with current_app.test_client() as client:
+        for path in ('/', '/expenses'):
+            client.get(path).get_data()  # a streamed page is only cached once its body has been read
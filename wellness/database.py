@@ -0,0 +1,45 @@
+"""Engine profile for the app database.
+
+SQLite runs in WAL mode so readers keep going while a worker writes. Each new
+connection gets the pragmas from SQLITE_PRAGMAS, including a busy timeout:
+a writer waits for the lock instead of failing with "database is locked".
+Setting DATABASE_URL to a server database (e.g. postgresql://...) skips the
+pragmas and uses a pre-pinged, recycled connection pool instead.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from .extensions import db
+
+
+def engine_options(uri):
+    """Default SQLALCHEMY_ENGINE_OPTIONS for a database URL."""
+    url = make_url(uri)
+    if url.get_backend_name() != 'sqlite':
+        return {'pool_size': 10, 'max_overflow': 20, 'pool_pre_ping': True, 'pool_recycle': 1800}
+    if url.database in (None, '', ':memory:'):
+        return {}  # Flask-SQLAlchemy shares a single connection for in-memory databases
+    # SQLite connections are cheap; keep one per request thread instead of reconnecting (and re-running pragmas)
+    return {'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 10}
+
+
+def init_sqlite_pragmas(engine, pragmas):
+    """Run `PRAGMA name=value` for each item on every new SQLite connection of the engine."""
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def upsert(table):
+    """INSERT ... ON CONFLICT statement for the app database (SQLite and PostgreSQL share the syntax)."""
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
@@ -0,0 +1,330 @@
+from datetime import datetime
+
+from flask import Blueprint, flash, get_flashed_messages, jsonify, redirect, request, url_for
+from sqlalchemy import extract, func, select, true, tuple_
+from sqlalchemy.orm import joinedload
+
+from .database import upsert
+from .extensions import db, job_runner, response_cache
+from .helpers import (StreamedPage, in_period, keyset_page, month_range, page_args, recent_month_starts, stream_page,
+                      week_range)
+from .models import Budget, Expense, ExpenseCategory, ExpenseMonthlyRollup
+
+bp = Blueprint('expenses', __name__, cli_group=None)
+
+#-------------------------------Expense aggregation helpers (computed in SQL, not Python)---------------------------#
+
+def expense_totals_by_category(month_start, category_ids=None):
+    """Sum of expenses per category for the month starting at month_start, as {category_id: total}."""
+    query = db.session.query(ExpenseMonthlyRollup.category_id, ExpenseMonthlyRollup.total).filter(
+        ExpenseMonthlyRollup.year == month_start.year,
+        ExpenseMonthlyRollup.month == month_start.month
+    )
+    if category_ids is not None:
+        query = query.filter(ExpenseMonthlyRollup.category_id.in_(category_ids))
+    return {category_id: total for category_id, total in query}
+
+def monthly_expense_trend(month_starts):
+    """Total spent in each month starting at the given dates, as a list of {'date', 'total'}.
+
+    The rollup only holds categorised spend, so each month adds the sum of its uncategorised expenses. One statement
+    with two indexed lookups per month.
+    """
+    if not month_starts:
+        return []
+    month_totals = [
+        func.coalesce(select(func.sum(ExpenseMonthlyRollup.total)).where(
+            ExpenseMonthlyRollup.year == start.year, ExpenseMonthlyRollup.month == start.month
+        ).scalar_subquery(), 0) + func.coalesce(select(func.sum(Expense.amount)).where(
+            Expense.category_id.is_(None), in_period(Expense.timestamp, month_range(start))
+        ).scalar_subquery(), 0)
+        for start in month_starts
+    ]
+    totals = db.session.execute(select(*month_totals)).one()
+    return [
+        {'date': start.strftime('%b %Y'), 'total': total}
+        for start, total in zip(month_starts, totals)
+    ]
+
+def _rollup_upsert():
+    """Upsert adding the inserted total and count onto an existing rollup row."""
+    stmt = upsert(ExpenseMonthlyRollup)
+    return stmt.on_conflict_do_update(
+        index_elements=['category_id', 'year', 'month'],
+        set_={
+            'total': ExpenseMonthlyRollup.total + stmt.excluded.total,
+            'count': ExpenseMonthlyRollup.count + stmt.excluded.count
+        }
+    )
+
+def record_expense_in_rollup(category_id, timestamp, amount):
+    """Add a new expense to its month's rollup row, inside the caller's transaction.
+
+    Returns the category's updated total for that month.
+    """
+    if category_id is None or timestamp is None:
+        return None
+    stmt = _rollup_upsert().values(
+        category_id=category_id,
+        year=timestamp.year,
+        month=timestamp.month,
+        total=amount,
+        count=1
+    ).returning(ExpenseMonthlyRollup.total)
+    return db.session.execute(stmt).scalar()
+
+def remove_expense_from_rollup(category_id, timestamp, amount):
+    """Take a deleted expense off its month's rollup row, inside the caller's transaction.
+
+    A plain UPDATE: a month with no rollup row yet (not backfilled) is left without one, never given a negative row.
+    """
+    if category_id is None or timestamp is None:
+        return
+    db.session.execute(db.update(ExpenseMonthlyRollup).where(
+        ExpenseMonthlyRollup.category_id == category_id,
+        ExpenseMonthlyRollup.year == timestamp.year,
+        ExpenseMonthlyRollup.month == timestamp.month
+    ).values(total=ExpenseMonthlyRollup.total - amount, count=ExpenseMonthlyRollup.count - 1))
+
+def record_expenses_in_rollup(rows):
+    """Add a batch of new expenses (dicts with category_id, timestamp and amount) to the rollup in one executemany."""
+    groups = {}
+    for row in rows:
+        if row['category_id'] is None:
+            continue
+        key = (row['category_id'], row['timestamp'].year, row['timestamp'].month)
+        total, count = groups.get(key, (0, 0))
+        groups[key] = (total + row['amount'], count + 1)
+    if groups:
+        db.session.execute(_rollup_upsert(), [
+            {'category_id': category_id, 'year': year, 'month': month, 'total': total, 'count': count}
+            for (category_id, year, month), (total, count) in groups.items()
+        ])
+
+def _replace_rollup_rows(rollup_filter, *expense_filter):
+    """Delete the rollup rows matching `rollup_filter` and re-insert them from the expenses matching `expense_filter`."""
+    year_col = extract('year', Expense.timestamp)
+    month_col = extract('month', Expense.timestamp)
+    totals = select(
+        Expense.category_id, year_col, month_col, func.sum(Expense.amount), func.count(Expense.id)
+    ).where(
+        Expense.category_id.is_not(None), Expense.timestamp.is_not(None), *expense_filter
+    ).group_by(Expense.category_id, year_col, month_col)
+    db.session.execute(db.delete(ExpenseMonthlyRollup).where(rollup_filter))
+    db.session.execute(db.insert(ExpenseMonthlyRollup).from_select(
+        ['category_id', 'year', 'month', 'total', 'count'], totals))
+    db.session.commit()
+
+def rebuild_expense_rollup():
+    """Recompute every rollup row from the expense table (a full scan; run by hand via `flask rebuild-expense-rollup`)."""
+    _replace_rollup_rows(true())
+
+ROLLUP_RECONCILE_MONTHS = 2  # the current and previous month, where edits and late imports land
+
+@job_runner.periodic('reconcile_expense_rollup', hours=24)
+def reconcile_expense_rollup(today=None):
+    """Recompute the rollup rows of the last ROLLUP_RECONCILE_MONTHS months from a timestamp range of expenses."""
+    month_starts = recent_month_starts(today or datetime.today().date(), ROLLUP_RECONCILE_MONTHS)
+    _replace_rollup_rows(
+        tuple_(ExpenseMonthlyRollup.year, ExpenseMonthlyRollup.month).in_(
+            [(start.year, start.month) for start in month_starts]),
+        in_period(Expense.timestamp, (month_starts[0], month_range(month_starts[-1])[1]))
+    )
+
+def expense_total(query):
+    """Sum of amounts for an (unordered) Expense query."""
+    return query.with_entities(func.sum(Expense.amount)).scalar() or 0
+
+#------------------------------------------------Route for expenses---------------------------------------------------#
+def expense_period(time_filter, today):
+    """The (start, end) the expense history's time filter limits it to, or None for all time."""
+    if time_filter == 'month':
+        return month_range(today)
+    if time_filter == 'week':
+        return week_range(today)
+    return None
+
+def filtered_expense_query(category_filter, time_filter, today):
+    """Expenses matching the category and time filters used by the expense history."""
+    query = Expense.query
+    if category_filter:
+        query = query.filter(Expense.category_id == category_filter)
+
+    period = expense_period(time_filter, today)
+    if period:
+        query = query.filter(in_period(Expense.timestamp, period))
+    return query
+
+
+@bp.route('/expenses', methods=['GET', 'POST'])
+@response_cache.cached('expenses')
+def expenses():
+    today = datetime.today()
+    current_month = today.month
+    current_year = today.year
+
+    # Handle filters
+    category_filter = request.args.get('category_filter', '')
+    time_filter = request.args.get('time_filter', 'all')
+    try:
+        per_page, cursor = page_args(datetime.fromisoformat, allow_all=True)
+    except ValueError:
+        return "Invalid cursor", 400
+
+    query = filtered_expense_query(category_filter, time_filter, today.date())
+
+    # Total covers every filtered expense; the list shows one page of them (or all with ?per_page=all),
+    # newest first, read from the database while the page streams out
+    total_expenses = expense_total(query)
+    # Legacy rows may have no timestamp; they are listed last unless a time filter leaves them out
+    filtered_expenses = StreamedPage(query.options(joinedload(Expense.category)), Expense.timestamp, Expense.id,
+                                     cursor, per_page, descending=True,
+                                     nullable=expense_period(time_filter, today.date()) is None)
+
+    # Get all categories and current month's budgets
+    categories = ExpenseCategory.query.all()
+    # Joined now: rows loaded here are detached by the time the streamed template reads them
+    budgets = Budget.query.options(joinedload(Budget.category)).filter(
+        Budget.month == current_month,
+        Budget.year == current_year
+    ).all()
+
+    # Monthly total per category for budget progress, read from the rollup table
+    category_totals = expense_totals_by_category(today.date())
+
+    # The session cookie is sent before the streamed body, so take the flashes off the session now;
+    # the template's get_flashed_messages() then reads them from the request
+    get_flashed_messages()
+
+    # The category and monthly trend charts load their data from /api/charts/
+    return stream_page(
+        'expenses.html',
+        expenses=filtered_expenses,
+        total=total_expenses,
+        categories=categories,
+        budgets=budgets,
+        category_totals=category_totals,
+        category_filter=category_filter,
+        time_filter=time_filter,
+        per_page=per_page,
+        cursor=cursor,
+        current_month=current_month,
+        current_year=current_year
+    )
+
+#----------------------------------------Route for Setting Budget-------------------------------------------------#
+@bp.route('/set_budget', methods=['POST'])
+def set_budget():
+    category_id = request.form.get('category_id')
+    amount = float(request.form.get('amount'))
+    today = datetime.today()
+
+    # Insert or update this category's budget for the month in a single statement
+    stmt = upsert(Budget).values(
+        category_id=category_id,
+        amount=amount,
+        month=today.month,
+        year=today.year
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['category_id', 'month', 'year'],
+        set_={'amount': stmt.excluded.amount}
+    )
+    db.session.execute(stmt)
+
+    db.session.commit()
+    response_cache.invalidate('expenses')
+    return redirect(url_for('expenses.expenses'))
+
+#-------------------------------------------Route for Adding Expense-------------------------------------------------#
+@bp.route('/add_expense', methods=['POST'])
+def add_expense():
+    description = request.form.get('description')
+    amount = float(request.form.get('amount'))
+    category_id = request.form.get('category_id', type=int)
+
+    new_expense = Expense(
+    description=description,
+    amount=amount,
+    category_id=category_id,
+    timestamp=datetime.now()  # Explicitly set current timestamp
+)
+    db.session.add(new_expense)
+    # Update the category's monthly total in the same transaction
+    spent = record_expense_in_rollup(category_id, new_expense.timestamp, amount)
+    budget_amount = None
+    if category_id is not None:  # budgets are per category; `== None` would match any NULL-category budgets
+        budget_amount = db.session.query(Budget.amount).filter(
+            Budget.category_id == category_id,
+            Budget.month == new_expense.timestamp.month,
+            Budget.year == new_expense.timestamp.year
+        ).scalar()
+    db.session.commit()
+    response_cache.invalidate('expenses')
+
+    if budget_amount is not None and spent > budget_amount:
+        flash(f'Over budget: ${spent:.2f} spent of ${budget_amount:.2f} this month', 'danger')
+
+    return redirect(url_for('expenses.expenses'))
+
+#----------------------------------------Route for Deleting an Expense-------------------------------------------------#
+@bp.route('/delete_expense/<int:expense_id>', methods=['POST'])
+def delete_expense(expense_id):
+    expense = Expense.query.get_or_404(expense_id)
+    remove_expense_from_rollup(expense.category_id, expense.timestamp, expense.amount)
+    db.session.delete(expense)
+    db.session.commit()
+    response_cache.invalidate('expenses')
+    return redirect(url_for('expenses.expenses'))
+
+#----------------------------------------Route for Budget Categories-------------------------------------------------#
+@bp.route('/init_categories')
+def init_categories():
+    categories = [
+        {'name': 'Food', 'color': '#FF6384'},
+        {'name': 'Transport', 'color': '#36A2EB'},
+        {'name': 'Entertainment', 'color': '#FFCE56'},
+        {'name': 'Utilities', 'color': '#4BC0C0'},
+        {'name': 'Shopping', 'color': '#9966FF'},
+        {'name': 'Health', 'color': '#FF9F40'},
+    ]
+
+    for cat in categories:
+        if not ExpenseCategory.query.filter_by(name=cat['name']).first():
+            new_cat = ExpenseCategory(name=cat['name'], color=cat['color'])
+            db.session.add(new_cat)
+
+    db.session.commit()
+    response_cache.invalidate('expenses')
+    return redirect(url_for('expenses.expenses'))
+
+#------------------------------Route serving the expense history as JSON for "load more"---------------------------------#
+@bp.route('/api/expenses')
+def api_expenses():
+    try:
+        per_page, cursor = page_args(datetime.fromisoformat)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    time_filter = request.args.get('time_filter', 'all')
+    today = datetime.today().date()
+    query = filtered_expense_query(request.args.get('category_filter', ''), time_filter, today)
+    expenses, next_cursor = keyset_page(query, Expense.timestamp, Expense.id, cursor, per_page, descending=True,
+                                        nullable=expense_period(time_filter, today) is None)
+    return jsonify({
+        'expenses': [{
+            'id': expense.id,
+            'description': expense.description,
+            'amount': expense.amount,
+            'timestamp': expense.timestamp.isoformat() if expense.timestamp else None,
+            'category_id': expense.category_id
+        } for expense in expenses],
+        'next_cursor': next_cursor
+    })
+
+#---------------------------------------CLI command to backfill the expense rollup-----------------------------------#
+@bp.cli.command('rebuild-expense-rollup')
+def rebuild_expense_rollup_command():
+    """Recompute the monthly expense rollup from the expense table."""
+    rebuild_expense_rollup()
+    print(f"Rebuilt {ExpenseMonthlyRollup.query.count()} expense rollup rows")
@@ -0,0 +1,29 @@
+"""Extension objects shared by the blueprints, bound to an app in create_app()."""
+from flask_migrate import Migrate
+from flask_sqlalchemy import SQLAlchemy
+
+from .api_client import ApiClient, ExerciseCache
+from .assets import StaticAssets
+from .cache import ResponseCache
+from .jobs import JobRunner
+from .metrics import RequestMetrics
+
+db = SQLAlchemy()
+migrate = Migrate()
+
+# Server-side cache for the read-heavy pages (see cache.py for the RESPONSE_CACHE_* settings)
+response_cache = ResponseCache()
+
+# Runner for the periodic jobs; only one process per host schedules them (see jobs.py)
+job_runner = JobRunner()
+
+# Fingerprinted, pre-compressed static files built by `flask build-assets` (see assets.py)
+static_assets = StaticAssets()
+
+# Per-endpoint latency and SQL counters served at /metrics (see metrics.py)
+request_metrics = RequestMetrics()
+
+# Outbound clients for the external APIs; base URLs and keys come from the config
+api_ninjas = ApiClient()
+affirmations_api = ApiClient()
+exercise_cache = ExerciseCache(api_ninjas)
@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+from flask import request, stream_template
+from sqlalchemy import and_, or_
+
+#------------------------------------------- Calendar period helpers ------------------------------------------------#
+# Periods are half-open (start, end) date pairs so filters stay index friendly: column >= start AND column < end
+
+def day_range(day):
+    return day, day + timedelta(days=1)
+
+def week_range(day):
+    start = day - timedelta(days=day.weekday())
+    return start, start + timedelta(days=7)
+
+def month_range(day):
+    start = day.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1)
+
+def recent_month_starts(day, count):
+    """First day of the `count` calendar months ending with the month of `day`, oldest first."""
+    starts = [day.replace(day=1)]
+    for _ in range(count - 1):
+        starts.append((starts[-1] - timedelta(days=1)).replace(day=1))
+    return starts[::-1]
+
+def in_period(column, period):
+    start, end = period
+    return and_(column >= start, column < end)
+
+#------------------------------------------- Keyset (seek) pagination ------------------------------------------------#
+# Pages are ordered by (sort column, id) and the cursor is the last row's "value,id", so each page is an index seek
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+STREAM_BATCH_SIZE = 100  # rows fetched per round trip while a streamed listing renders
+STREAM_CHUNK_SIZE = 8192  # characters per chunk written while a streamed page renders
+
+def page_args(parse_value, allow_all=False):
+    """Read per_page and the `after` cursor from the query string. Raises ValueError for a malformed cursor.
+
+    With `allow_all`, ?per_page=all gives a per_page of None: every row after the cursor, for streamed listings.
+    """
+    if allow_all and request.args.get('per_page') == 'all':
+        per_page = None
+    else:
+        per_page = request.args.get('per_page', DEFAULT_PAGE_SIZE, type=int)
+        per_page = max(1, min(per_page, MAX_PAGE_SIZE))
+    after = request.args.get('after')
+    if not after:
+        return per_page, None
+    value, _, last_id = after.rpartition(',')
+    # An empty value is a cursor on a row whose sort value is NULL (see _seek_phases)
+    return per_page, (parse_value(value) if value else None, int(last_id))
+
+def _seek_phases(query, sort_column, id_column, cursor, descending, nullable):
+    """The queries for the rows after the cursor, in page order, each ordered by (sort column, id).
+
+    SQLite sorts NULLs first ascending and last descending, and `column < value` never matches a NULL. So a
+    nullable sort column is read as two index ranges: rows with a value, and rows without one ordered by id.
+    `nullable` defaults to the column's; pass False when the query's filters already rule out NULLs.
+    """
+    value, last_id = cursor or (None, None)
+    if nullable is None:
+        nullable = getattr(sort_column.expression, 'nullable', False)
+    after_id = (id_column < last_id if descending else id_column > last_id) if cursor else None
+
+    valued = query.filter(sort_column.is_not(None)) if nullable else query
+    if value is not None:
+        if descending:
+            valued = valued.filter(sort_column <= value, or_(sort_column < value, after_id))
+        else:
+            valued = valued.filter(sort_column >= value, or_(sort_column > value, after_id))
+    valued = valued.order_by(*((sort_column.desc(), id_column.desc()) if descending else (sort_column, id_column)))
+    if not nullable:
+        return [valued]
+
+    null = query.filter(sort_column.is_(None))
+    if cursor and value is None:
+        null = null.filter(after_id)
+    null = null.order_by(id_column.desc() if descending else id_column)
+    if descending:
+        return [null] if cursor and value is None else [valued, null]
+    return [valued] if value is not None else [null, valued]
+
+def _cursor_after(row, sort_column, id_column):
+    value = getattr(row, sort_column.key)
+    return f"{'' if value is None else value.isoformat()},{getattr(row, id_column.key)}"
+
+def keyset_page(query, sort_column, id_column, cursor, per_page, descending=False, nullable=None):
+    """Return one page of rows after the cursor and the cursor for the next page (None on the last page)."""
+    rows = []
+    for phase in _seek_phases(query, sort_column, id_column, cursor, descending, nullable):
+        rows += phase.limit(per_page + 1 - len(rows)).all()
+        if len(rows) > per_page:
+            rows = rows[:per_page]
+            return rows, _cursor_after(rows[-1], sort_column, id_column)
+    return rows, None
+
+
+class StreamedPage:
+    """A keyset page read lazily, STREAM_BATCH_SIZE rows at a time, for templates rendered with stream_page.
+
+    Iterate it once; `next_cursor` is only known after the last row has been yielded, so templates
+    read it below the listing. A per_page of None streams every row after the cursor.
+    """
+
+    def __init__(self, query, sort_column, id_column, cursor, per_page, descending=False, nullable=None):
+        self.phases = _seek_phases(query, sort_column, id_column, cursor, descending, nullable)
+        self.sort_column = sort_column
+        self.id_column = id_column
+        self.per_page = per_page
+        self.next_cursor = None
+
+    def __iter__(self):
+        last = None
+        count = 0
+        for phase in self.phases:
+            if self.per_page is not None:
+                phase = phase.limit(self.per_page + 1 - count)
+            for row in phase.yield_per(STREAM_BATCH_SIZE):
+                if count == self.per_page:
+                    # The one extra row fetched (always the last) only says there is another page
+                    self.next_cursor = _cursor_after(last, self.sort_column, self.id_column)
+                    return
+                count += 1
+                last = row
+                yield row
+
+
+def stream_page(template_name, **context):
+    """stream_template, with the template's many small output pieces sent in chunks of about STREAM_CHUNK_SIZE."""
+    return _chunked(stream_template(template_name, **context))
+
+def _chunked(pieces):
+    buffer, size = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_SIZE:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
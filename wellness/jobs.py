@@ -0,0 +1,143 @@
+"""Managed runner for the app's periodic jobs.
+
+Jobs are registered at import time with `@job_runner.periodic(...)` but nothing
+runs until `start()` is called. Only the process holding the lock file becomes
+the scheduler, so several gunicorn workers or the Flask reloader never fire
+duplicate jobs. Schedules live in a SQLAlchemy job store, so a restart keeps
+each job's next run time instead of resetting its countdown.
+"""
+import atexit
+import os
+import threading
+import time
+from datetime import datetime
+
+# job id -> (runner, func); looked up by run_registered_job so the job store only persists the id
+_registry = {}
+
+
+def run_registered_job(job_id):
+    """Entry point stored in the job store: run a registered job inside its app context."""
+    runner, func = _registry[job_id]
+    with runner.app.app_context():
+        try:
+            func()
+        except Exception:
+            runner.app.logger.exception("Job %s failed", job_id)
+
+
+def _acquire_lock(path):
+    """Try to take an exclusive lock on `path` without blocking. Returns the open file, or None if held elsewhere."""
+    lock_file = open(path, 'a+')
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+class JobRunner:
+    """Single APScheduler instance per host, elected with a lock file.
+
+    Configured from the app config:
+      JOBS_LOCK_FILE       lock file used for leader election (default: instance/jobs.lock)
+      JOBS_DATABASE_URI    job store database (default: SQLALCHEMY_DATABASE_URI)
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self.scheduler = None
+        self._lock_file = None
+        self._start_lock = threading.Lock()
+        self._next_attempt = 0
+        self._jobs = {}  # job id -> (trigger kwargs, first run delay)
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['job_runner'] = self
+
+    def periodic(self, job_id, run_after=None, **interval):
+        """Register the decorated function to run every `interval` (e.g. minutes=1, hours=24).
+
+        `run_after` (a timedelta) schedules the first run that long after the first start
+        instead of one full interval later.
+        """
+        def decorator(func):
+            _registry[job_id] = (self, func)
+            self._jobs[job_id] = (interval, run_after)
+            return func
+        return decorator
+
+    @property
+    def running(self):
+        return self.scheduler is not None
+
+    def try_start(self, retry_after=60):
+        """Cheap enough to call on every request: attempts start() at most once every `retry_after` seconds."""
+        if self.running or time.monotonic() < self._next_attempt:
+            return self.running
+        self._next_attempt = time.monotonic() + retry_after
+        return self.start()
+
+    def start(self):
+        """Start scheduling if this process wins the lock. Returns True if this process runs the jobs."""
+        with self._start_lock:
+            if self.running:
+                return True
+            return self._start()
+
+    def _start(self):
+        config = self.app.config
+        lock_path = config.get('JOBS_LOCK_FILE') or os.path.join(self.app.instance_path, 'jobs.lock')
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        self._lock_file = _acquire_lock(lock_path)
+        if self._lock_file is None:
+            return False
+
+        # APScheduler is only imported by the process that actually schedules, keeping it out of app startup
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        jobstore = SQLAlchemyJobStore(url=config.get('JOBS_DATABASE_URI') or config['SQLALCHEMY_DATABASE_URI'])
+        self.scheduler = BackgroundScheduler(
+            jobstores={'default': jobstore},
+            job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 300}
+        )
+        # Start paused so persisted jobs can be reconciled with the registered ones before anything fires
+        self.scheduler.start(paused=True)
+        self._sync_jobs()
+        atexit.register(self.shutdown)
+        self.scheduler.resume()
+        return True
+
+    def _sync_jobs(self):
+        existing = {job.id: job for job in self.scheduler.get_jobs()}
+        for job_id in set(existing) - set(self._jobs):
+            self.scheduler.remove_job(job_id)
+        for job_id, (interval, run_after) in self._jobs.items():
+            kwargs = {}
+            if job_id in existing and existing[job_id].next_run_time:
+                kwargs['next_run_time'] = existing[job_id].next_run_time
+            elif run_after is not None:
+                kwargs['next_run_time'] = datetime.now() + run_after
+            self.scheduler.add_job(
+                run_registered_job, 'interval', args=[job_id], id=job_id,
+                replace_existing=True, **interval, **kwargs
+            )
+
+    def shutdown(self):
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self.scheduler = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
@@ -0,0 +1,204 @@
+"""Per-endpoint request latency and SQL accounting.
+
+Every request records its wall time, plus the number and total time of the
+SQL statements it ran (counted through the engine's before/after_cursor_execute
+events). Totals are kept per endpoint in this process and rendered in the
+Prometheus text format for /metrics. Each response also gets a Server-Timing
+header, so the numbers for a single page show up in the browser's dev tools.
+
+Configured from the app config:
+  METRICS_ENABLED    record requests (default True)
+  SLOW_QUERY_MS      log statements slower than this many milliseconds (default: off)
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+import threading
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+# Upper bounds (seconds) of the request duration histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+RecordedQuery = namedtuple('RecordedQuery', 'statement parameters seconds')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by assert_max_queries when a block runs more statements than allowed."""
+
+
+class EndpointStats:
+    def __init__(self):
+        self.requests = {}  # (method, status) -> count
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.duration = 0.0
+        self.queries = 0
+        self.sql_time = 0.0
+
+    def add(self, method, status, duration, queries, sql_time):
+        self.requests[(method, status)] = self.requests.get((method, status), 0) + 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+        self.duration += duration
+        self.queries += queries
+        self.sql_time += sql_time
+
+    @property
+    def count(self):
+        return sum(self.requests.values())
+
+
+class RequestMetrics:
+    """Collects request and SQL timings per endpoint; see the module docstring for settings."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.endpoints = {}  # endpoint -> EndpointStats
+        self.slow_query_seconds = None
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread list of active query recorders
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        slow_ms = app.config.get('SLOW_QUERY_MS')
+        self.slow_query_seconds = slow_ms / 1000 if slow_ms else None
+        app.extensions['request_metrics'] = self
+        if app.config.get('METRICS_ENABLED', True):
+            app.before_request(self._start_request)
+            app.after_request(self._finish_response)
+            app.teardown_request(self._record_request)
+
+    def watch_engine(self, engine):
+        """Count and time every statement the engine runs."""
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    # -- SQL events ------------------------------------------------------------------------------------------------
+
+    def _recorders(self):
+        recorders = getattr(self._local, 'recorders', None)
+        if recorders is None:
+            recorders = self._local.recorders = []
+        return recorders
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        for recorder in self._recorders():
+            recorder.append(RecordedQuery(statement, parameters, elapsed))
+        if self.slow_query_seconds is not None and elapsed >= self.slow_query_seconds:
+            where = request.endpoint if has_request_context() else 'outside a request'
+            self.app.logger.warning("Slow query (%.1f ms, %s): %s", elapsed * 1000, where, statement)
+
+    @contextmanager
+    def record_queries(self):
+        """Collect a RecordedQuery (statement, parameters, seconds) for each statement this thread runs in the block."""
+        queries = []
+        self._recorders().append(queries)
+        try:
+            yield queries
+        finally:
+            self._recorders().remove(queries)
+
+    @contextmanager
+    def assert_max_queries(self, limit):
+        """Fail with QueryBudgetExceeded if the block runs more than `limit` SQL statements.
+
+            with request_metrics.assert_max_queries(6):
+                client.get('/expenses')
+        """
+        with self.record_queries() as queries:
+            yield queries
+        if len(queries) > limit:
+            statements = '\n'.join(f'  {query.statement}' for query in queries)
+            raise QueryBudgetExceeded(f"{len(queries)} queries (budget {limit}):\n{statements}")
+
+    # -- Request hooks ---------------------------------------------------------------------------------------------
+
+    def _start_request(self):
+        g.metrics_started = time.perf_counter()
+        g.metrics_queries = []
+        self._recorders().append(g.metrics_queries)
+
+    def _finish_response(self, response):
+        queries = g.get('metrics_queries')
+        if queries is not None:
+            g.metrics_status = response.status_code
+            g.metrics_streamed = response.is_streamed
+            app_ms = (time.perf_counter() - g.metrics_started) * 1000
+            db_ms = sum(query.seconds for query in queries) * 1000
+            response.headers.add(
+                'Server-Timing', f'app;dur={app_ms:.1f}, db;dur={db_ms:.1f};desc="{len(queries)} queries"')
+        return response
+
+    def _record_request(self, exc):
+        # A stream_with_context body tears the request down twice: when the view returns and again once the
+        # body has been sent. Record on the last one so the body's queries and time are included.
+        if g.pop('metrics_streamed', False) and exc is None:
+            return
+        queries = g.pop('metrics_queries', None)
+        if queries is None:
+            return
+        if queries in self._recorders():
+            self._recorders().remove(queries)
+        duration = time.perf_counter() - g.pop('metrics_started')
+        status = 500 if exc is not None else g.pop('metrics_status', 500)
+        endpoint = request.endpoint or 'unmatched'
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+            stats.add(request.method, status, duration, len(queries), sum(query.seconds for query in queries))
+
+    # -- Exposition ------------------------------------------------------------------------------------------------
+
+    def render(self, extra=()):
+        """The collected metrics in the Prometheus text exposition format.
+
+        `extra` is an iterable of (name, type, help, value) for process-wide gauges and counters.
+        """
+        with self._lock:
+            endpoints = {name: stats for name, stats in sorted(self.endpoints.items())}
+            lines = [
+                '# HELP wellness_http_requests_total Requests handled, by endpoint, method and status.',
+                '# TYPE wellness_http_requests_total counter',
+            ]
+            for name, stats in endpoints.items():
+                for (method, status), count in sorted(stats.requests.items()):
+                    lines.append(f'wellness_http_requests_total{{endpoint="{name}",method="{method}",'
+                                 f'status="{status}"}} {count}')
+
+            lines += [
+                '# HELP wellness_http_request_duration_seconds Wall time per request, including streamed bodies.',
+                '# TYPE wellness_http_request_duration_seconds histogram',
+            ]
+            for name, stats in endpoints.items():
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    lines.append(f'wellness_http_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} '
+                                 f'{count}')
+                lines.append(f'wellness_http_request_duration_seconds_bucket{{endpoint="{name}",le="+Inf"}} '
+                             f'{stats.count}')
+                lines.append(f'wellness_http_request_duration_seconds_sum{{endpoint="{name}"}} {stats.duration:.6f}')
+                lines.append(f'wellness_http_request_duration_seconds_count{{endpoint="{name}"}} {stats.count}')
+
+            lines += [
+                '# HELP wellness_sql_queries_total SQL statements run while handling requests.',
+                '# TYPE wellness_sql_queries_total counter',
+            ]
+            lines += [f'wellness_sql_queries_total{{endpoint="{name}"}} {stats.queries}'
+                      for name, stats in endpoints.items()]
+            lines += [
+                '# HELP wellness_sql_duration_seconds_total Time spent in SQL statements while handling requests.',
+                '# TYPE wellness_sql_duration_seconds_total counter',
+            ]
+            lines += [f'wellness_sql_duration_seconds_total{{endpoint="{name}"}} {stats.sql_time:.6f}'
+                      for name, stats in endpoints.items()]
+
+        for name, kind, help_text, value in extra:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}', f'{name} {value}']
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,149 @@
+from .extensions import db
+
+#-------------------------------------- Define the database models------------------------------------------------#
+
+# Task model: Represents a to-do task with a description, completion status, and date
+class Task(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    description = db.Column(db.String(200), nullable=False)
+    completed = db.Column(db.Boolean, default=False)
+    date = db.Column(db.Date, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_task_date', 'date'),
+        db.Index('ix_task_completed_date', 'completed', 'date'),
+    )
+
+# RecurringTask model: A repeating task rule (every N days, N weeks on given weekdays, or N months on the start
+# date's day). Occurrences are expanded on the fly for the dates being shown; only exceptions are stored
+class RecurringTask(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    description = db.Column(db.String(200), nullable=False)
+    frequency = db.Column(db.String(10), nullable=False)  # 'daily', 'weekly' or 'monthly'
+    interval = db.Column(db.Integer, nullable=False, default=1)
+    weekdays = db.Column(db.String(7))  # Weekly rules: weekday numbers, Monday = 0 (e.g. '024')
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date)  # Last possible occurrence; None repeats forever
+
+    __table_args__ = (
+        db.Index('ix_recurring_task_start_end', 'start_date', 'end_date'),
+    )
+
+# RecurringTaskException model: A completed or skipped occurrence of a recurring task
+class RecurringTaskException(db.Model):
+    recurring_task_id = db.Column(db.Integer, db.ForeignKey('recurring_task.id', ondelete='CASCADE'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    completed = db.Column(db.Boolean, nullable=False, default=False)
+    skipped = db.Column(db.Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        db.Index('ix_recurring_task_exception_date', 'date'),
+    )
+
+# Affirmation model: Represents a positive affirmation message
+class Affirmation(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    message = db.Column(db.String(200), nullable=False)
+
+# WaterLog model: Tracks water intake with timestamp and amount
+class WaterLog(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    timestamp = db.Column(db.DateTime, default=db.func.now())
+    amount = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_water_log_timestamp', 'timestamp'),
+    )
+
+# WaterDaily model: Per-day water intake total and goal, updated together with each WaterLog entry
+DEFAULT_WATER_GOAL = 2000  # ml
+
+class WaterDaily(db.Model):
+    day = db.Column(db.Date, primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    target = db.Column(db.Integer, nullable=False, default=DEFAULT_WATER_GOAL)
+
+# Expense model: Tracks financial expenses with a description, amount, category, and timestamp
+class Expense(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    description = db.Column(db.String(200), nullable=False)
+    amount = db.Column(db.Float, nullable=False)
+    timestamp = db.Column(db.DateTime, default=db.func.now())
+    category_id = db.Column(db.Integer, db.ForeignKey('expense_category.id'))
+
+    category = db.relationship('ExpenseCategory')
+
+    __table_args__ = (
+        db.Index('ix_expense_timestamp', 'timestamp'),
+        db.Index('ix_expense_category_timestamp', 'category_id', 'timestamp'),
+    )
+
+# ExpenseCategory model: Represents a category for expenses (e.g., food, rent)
+class ExpenseCategory(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, unique=True)
+    color = db.Column(db.String(7))  # Hex color code
+
+# Budget model: Represents a budget for a specific category, month, and year
+class Budget(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('expense_category.id'))
+    amount = db.Column(db.Float, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    year = db.Column(db.Integer, nullable=False)
+# Establish relationship with the ExpenseCategory model
+    category = db.relationship('ExpenseCategory')
+
+    __table_args__ = (
+        db.UniqueConstraint('category_id', 'month', 'year', name='uq_budget_category_month_year'),
+        db.Index('ix_budget_year_month', 'year', 'month'),
+    )
+
+# ExpenseMonthlyRollup model: Running total and count of expenses per category and calendar month,
+# kept up to date by add_expense/delete_expense so dashboards never have to scan the expense table
+class ExpenseMonthlyRollup(db.Model):
+    category_id = db.Column(db.Integer, db.ForeignKey('expense_category.id'), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)
+    total = db.Column(db.Float, nullable=False, default=0)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_expense_monthly_rollup_year_month', 'year', 'month'),
+    )
+
+# Exercise model: Local catalog of api-ninjas exercises, prefetched per muscle group so workouts don't wait on the API
+class Exercise(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    type = db.Column(db.String(50))
+    muscle = db.Column(db.String(50), nullable=False)
+    equipment = db.Column(db.String(100))
+    difficulty = db.Column(db.String(50))
+    instructions = db.Column(db.Text)
+
+    __table_args__ = (
+        db.UniqueConstraint('muscle', 'name', name='uq_exercise_muscle_name'),
+        db.Index('ix_exercise_type', 'type'),
+        db.Index('ix_exercise_difficulty', 'difficulty'),
+    )
+
+# Meal model: A food item logged in the nutrition tracker with its calories and protein
+class Meal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    food = db.Column(db.String(200), nullable=False)
+    calories = db.Column(db.Integer, nullable=False, default=0)
+    protein = db.Column(db.Integer, nullable=False, default=0)
+    meal_type = db.Column(db.String(20))
+    timestamp = db.Column(db.DateTime, default=db.func.now())
+
+    __table_args__ = (
+        db.Index('ix_meal_timestamp', 'timestamp'),
+    )
+
+# Activity model: Tracks physical activities with type, duration, and date
+class Activity(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    activity_type = db.Column(db.String(100), nullable=False)
+    duration = db.Column(db.Float, nullable=False)  # Duration in minutes
+    date = db.Column(db.Date, nullable=False)
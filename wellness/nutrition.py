@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from flask import Blueprint, flash, redirect, render_template, request, session, url_for
+from sqlalchemy import func
+
+from .extensions import db
+from .helpers import day_range, in_period
+from .models import Meal
+
+bp = Blueprint('nutrition', __name__)
+
+#-----------------------------------Route Logs and tracks meals, calories, and protein.-------------------------------#
+# Default nutrition goals
+DEFAULT_GOALS = {
+    'calories': 2000,
+    'protein': 150
+}
+
+def reset_todays_meals():
+    Meal.query.filter(in_period(Meal.timestamp, day_range(datetime.today().date()))).delete()
+    db.session.commit()
+
+@bp.route('/nutrition', methods=['GET', 'POST'])
+def nutrition():
+    # Meals used to live in the cookie session; drop any leftover list so the cookie stays small
+    session.pop('meals', None)
+
+    # Handle form submission
+    if request.method == 'POST':
+        # Check if it's a reset request
+        if request.form.get('_method') == 'DELETE':
+            reset_todays_meals()
+            flash('Nutrition log has been reset', 'success')
+            return redirect(url_for('nutrition.nutrition'))
+
+        # Handle food addition
+        new_meal = Meal(
+            food=request.form.get('food_name'),
+            calories=int(request.form.get('calories', 0)),
+            protein=int(request.form.get('protein', 0)),
+            meal_type=request.form.get('meal_type'),
+            timestamp=datetime.now()
+        )
+        db.session.add(new_meal)
+        db.session.commit()
+        flash('Food item added successfully!', 'success')
+        return redirect(url_for('nutrition.nutrition'))
+
+    # Today's meals and their totals, summed in SQL
+    today = in_period(Meal.timestamp, day_range(datetime.today().date()))
+    meals = Meal.query.filter(today).order_by(Meal.timestamp).all()
+    calories, protein = db.session.query(
+        func.coalesce(func.sum(Meal.calories), 0),
+        func.coalesce(func.sum(Meal.protein), 0)
+    ).filter(today).one()
+    totals = {'calories': calories, 'protein': protein}
+
+    return render_template('nutrition.html',
+                        meals=meals,
+                        totals=totals,
+                        goals=session.get('goals', DEFAULT_GOALS))
+
+
+#--------------------------------------------Route Clears all tracked meals.-------------------------------------------#
+@bp.route('/reset_nutrition', methods=['POST'])
+def reset_nutrition():
+    reset_todays_meals()
+    flash('Nutrition log has been reset', 'success')
+    return redirect(url_for('nutrition.nutrition'))
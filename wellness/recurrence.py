@@ -0,0 +1,179 @@
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, redirect, request, url_for
+from sqlalchemy import or_
+
+from .database import upsert
+from .extensions import db, response_cache
+from .models import RecurringTask, RecurringTaskException
+
+bp = Blueprint('recurring', __name__)
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+# One expanded occurrence, shaped like a Task for the templates (description, date, completed)
+Occurrence = namedtuple('Occurrence', 'rule_id description date completed')
+
+#------------------------------------------- Lazy occurrence expansion ----------------------------------------------#
+
+def _months_between(start, day):
+    return (day.year - start.year) * 12 + day.month - start.month
+
+def occurrence_dates(rule, start, end):
+    """Dates in the half-open range [start, end) on which the rule repeats."""
+    first = max(start, rule.start_date)
+    last = min(end, rule.end_date + timedelta(days=1)) if rule.end_date else end
+    if first >= last:
+        return []
+    interval = max(rule.interval or 1, 1)
+
+    if rule.frequency == 'daily':
+        # Jump straight to the first matching day instead of walking from the rule's start
+        offset = -(first - rule.start_date).days % interval
+        day = first + timedelta(days=offset)
+        dates = []
+        while day < last:
+            dates.append(day)
+            day += timedelta(days=interval)
+        return dates
+
+    if rule.frequency == 'weekly':
+        weekdays = {int(d) for d in (rule.weekdays or str(rule.start_date.weekday()))}
+        rule_week = rule.start_date - timedelta(days=rule.start_date.weekday())
+        days = (first + timedelta(days=i) for i in range((last - first).days))
+        return [
+            day for day in days
+            if day.weekday() in weekdays and ((day - rule_week).days // 7) % interval == 0
+        ]
+
+    # Monthly on the start date's day of the month; months without that day (e.g. the 31st) are skipped
+    dates = []
+    month = first.replace(day=1)
+    while month < last:
+        if _months_between(rule.start_date, month) % interval == 0:
+            try:
+                day = month.replace(day=rule.start_date.day)
+            except ValueError:
+                day = None
+            if day and first <= day < last:
+                dates.append(day)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return dates
+
+def expand_occurrences(start, end, include_completed=True):
+    """Occurrences of every recurring task in [start, end), sorted by date, with their stored completions/skips applied.
+
+    Two indexed queries whatever the range: the rules active in the range and the exceptions inside it.
+    """
+    rules = RecurringTask.query.filter(
+        RecurringTask.start_date < end,
+        or_(RecurringTask.end_date.is_(None), RecurringTask.end_date >= start)
+    ).all()
+    if not rules:
+        return []
+    exceptions = {
+        (row.recurring_task_id, row.date): row
+        for row in RecurringTaskException.query.filter(
+            RecurringTaskException.date >= start,
+            RecurringTaskException.date < end,
+            RecurringTaskException.recurring_task_id.in_([rule.id for rule in rules])
+        )
+    }
+
+    occurrences = []
+    for rule in rules:
+        for day in occurrence_dates(rule, start, end):
+            exception = exceptions.get((rule.id, day))
+            if exception and exception.skipped:
+                continue
+            completed = bool(exception and exception.completed)
+            if completed and not include_completed:
+                continue
+            occurrences.append(Occurrence(rule.id, rule.description, day, completed))
+    occurrences.sort(key=lambda occurrence: (occurrence.date, occurrence.description))
+    return occurrences
+
+def set_exception(rule_id, day, **state):
+    """Store (or update) the completed/skipped state of one occurrence."""
+    stmt = upsert(RecurringTaskException).values(recurring_task_id=rule_id, date=day, **state)
+    stmt = stmt.on_conflict_do_update(index_elements=['recurring_task_id', 'date'], set_=state)
+    db.session.execute(stmt)
+
+#-----------------------------------------Route to add a recurring task----------------------------------------------#
+@bp.route('/add_recurring_task', methods=['POST'])
+def add_recurring_task():
+    description = request.form.get('description')
+    frequency = request.form.get('frequency')
+    interval = request.form.get('interval', 1, type=int)
+    weekdays = ''.join(sorted(set(d for d in request.form.getlist('weekdays') if d in '0123456')))
+
+    if not description or frequency not in FREQUENCIES or not interval or interval < 1:
+        return "Missing data", 400
+    try:
+        start_date = datetime.strptime(request.form.get('start_date', ''), "%Y-%m-%d").date()
+        end_str = request.form.get('end_date')
+        end_date = datetime.strptime(end_str, "%Y-%m-%d").date() if end_str else None
+    except ValueError:
+        return "Invalid date format", 400
+
+    db.session.add(RecurringTask(
+        description=description,
+        frequency=frequency,
+        interval=interval,
+        weekdays=(weekdays or str(start_date.weekday())) if frequency == 'weekly' else None,
+        start_date=start_date,
+        end_date=end_date
+    ))
+    db.session.commit()
+    response_cache.invalidate('tasks')
+    return redirect(url_for('tasks.calendar_view'))
+
+#-----------------------------Routes to complete or skip one occurrence, or stop repeating-----------------------------#
+def _occurrence_or_404(rule_id, day_str):
+    rule = RecurringTask.query.get_or_404(rule_id)
+    try:
+        day = date.fromisoformat(day_str)
+    except ValueError:
+        return rule, None
+    return rule, day if day in occurrence_dates(rule, day, day + timedelta(days=1)) else None
+
+@bp.route('/complete_occurrence/<int:rule_id>/<day>')
+def complete_occurrence(rule_id, day):
+    rule, day = _occurrence_or_404(rule_id, day)
+    if day is None:
+        return "Invalid occurrence", 400
+    set_exception(rule.id, day, completed=True)
+    db.session.commit()
+    response_cache.invalidate('tasks')
+    return redirect(request.referrer or url_for('tasks.task_manager'))
+
+@bp.route('/skip_occurrence/<int:rule_id>/<day>')
+def skip_occurrence(rule_id, day):
+    rule, day = _occurrence_or_404(rule_id, day)
+    if day is None:
+        return "Invalid occurrence", 400
+    set_exception(rule.id, day, skipped=True)
+    db.session.commit()
+    response_cache.invalidate('tasks')
+    return redirect(request.referrer or url_for('tasks.task_manager'))
+
+@bp.route('/stop_recurring_task/<int:rule_id>/<day>')
+def stop_recurring_task(rule_id, day):
+    """End the series before `day`; earlier occurrences (and their completions) are kept."""
+    rule, day = _occurrence_or_404(rule_id, day)
+    if day is None:
+        return "Invalid occurrence", 400
+    if day <= rule.start_date:
+        RecurringTaskException.query.filter_by(recurring_task_id=rule.id).delete()
+        db.session.delete(rule)
+    else:
+        rule.end_date = day - timedelta(days=1)
+        RecurringTaskException.query.filter(
+            RecurringTaskException.recurring_task_id == rule.id,
+            RecurringTaskException.date >= day
+        ).delete()
+    db.session.commit()
+    response_cache.invalidate('tasks')
+    return redirect(request.referrer or url_for('tasks.task_manager'))
@@ -0,0 +1,287 @@
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, jsonify, redirect, render_template, request, url_for
+from sqlalchemy import and_, case, delete, func, insert, update
+
+from .extensions import db, response_cache
+from .helpers import (StreamedPage, day_range, in_period, keyset_page, month_range, page_args, stream_page,
+                      week_range)
+from .models import Task
+from .recurrence import FREQUENCIES, WEEKDAY_NAMES, expand_occurrences
+
+bp = Blueprint('tasks', __name__)
+
+#------------------------------------------------Route to add task-----------------------------------------------------#
+@bp.route('/add_task', methods=['POST'])
+def add_task():
+
+    description = request.form.get('description')
+    date_str = request.form.get('date')
+
+    if not description or not date_str:
+        return "Missing data", 400
+
+    try:
+        date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return "Invalid date format", 400
+
+    new_task = Task(description=description, date=date)
+    db.session.add(new_task)
+    db.session.commit()
+    response_cache.invalidate('tasks')
+    return redirect(url_for('tasks.calendar_view'))
+
+#------------------------Route to Mark a task as completed and return to the same page----------------------------------#
+
+@bp.route('/complete_task/<int:task_id>')
+def complete_task(task_id):
+
+    task = Task.query.get(task_id)
+    if task:
+        task.completed = True
+        db.session.commit()
+        response_cache.invalidate('tasks')
+    # Stay on the task manager page after marking as complete
+    return redirect(request.referrer or url_for('tasks.task_manager'))
+
+#------------------------------------------Route to Delete a task---------------------------------------------------#
+@bp.route('/delete_task/<int:task_id>')
+def delete_task(task_id):
+    """Delete a task and redirect to the previous page"""
+    task = Task.query.get(task_id)
+    if task:
+        db.session.delete(task)
+        db.session.commit()
+        response_cache.invalidate('tasks')
+    return redirect(request.referrer or url_for('tasks.task_manager'))
+
+
+#------------------------------Route for Displaying calendar with tasks -------------------------------------------------#
+@bp.route('/calendar')
+@response_cache.cached('tasks')
+def calendar_view():
+    # Events are fetched by the calendar for the visible range from /api/calendar/events
+    return render_template('calendar.html', frequencies=FREQUENCIES, weekday_names=WEEKDAY_NAMES)
+
+#------------------------------Route serving calendar events for the visible date range----------------------------------#
+@bp.route('/api/calendar/events')
+@response_cache.cached('tasks')
+def calendar_events():
+    try:
+        # FullCalendar sends ISO timestamps (e.g. 2025-04-27T00:00:00-04:00); only the date part matters
+        start = date.fromisoformat(request.args['start'][:10])
+        end = date.fromisoformat(request.args['end'][:10])
+    except (KeyError, ValueError):
+        return jsonify({'error': 'start and end dates are required'}), 400
+
+    rows = db.session.query(Task.id, Task.description, Task.date).filter(
+        Task.completed == False,
+        in_period(Task.date, (start, end))
+    ).order_by(Task.date, Task.id)
+
+    events = [
+        {'id': task_id, 'title': description, 'start': task_date.isoformat()}
+        for task_id, description, task_date in rows
+    ]
+    # Recurring tasks are expanded for the visible range only
+    events += [
+        {'id': f'r{occurrence.rule_id}-{occurrence.date.isoformat()}', 'title': occurrence.description,
+         'start': occurrence.date.isoformat(), 'classNames': ['recurring']}
+        for occurrence in expand_occurrences(start, end, include_completed=False)
+    ]
+
+    response = jsonify(events)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+#-------------------------------Task statistics computed with conditional aggregation-----------------------------------#
+class TaskStats:
+    """Completion statistics for tasks relative to `today`, each computed in a single SQL query."""
+
+    def __init__(self, today):
+        self.today = today
+
+    def summary(self):
+        """Completed/pending totals and completions today, this week and this month."""
+        def count_if(*conditions):
+            return func.count(case((and_(*conditions), 1)))
+
+        done = Task.completed.is_(True)
+        row = db.session.query(
+            count_if(done).label('completed'),
+            count_if(Task.completed.is_(False)).label('pending'),
+            count_if(done, Task.date == self.today).label('daily_completed'),
+            count_if(done, in_period(Task.date, week_range(self.today))).label('weekly_completed'),
+            count_if(done, in_period(Task.date, month_range(self.today))).label('monthly_completed'),
+        ).one()
+        return row._asdict()
+
+    def daily_completions(self, days):
+        """Completed tasks per day for the last `days` days up to today, oldest first, as (date, count) pairs."""
+        start = self.today - timedelta(days=days - 1)
+        rows = db.session.query(Task.date, func.count(Task.id)).filter(
+            Task.completed.is_(True),
+            in_period(Task.date, (start, self.today + timedelta(days=1)))
+        ).group_by(Task.date)
+        counts = dict(rows.all())
+        return [(day, counts.get(day, 0)) for day in (start + timedelta(days=i) for i in range(days))]
+
+#-------------------------------Route Generates productivity charts based on task data----------------------------------#
+TREND_RANGES = (7, 30, 90)  # Selectable day ranges for the completion trend chart
+
+@bp.route('/productivity_report')
+def productivity_report():
+    """Productivity charts; their data is fetched from /api/charts/ after the page loads."""
+    trend_days = request.args.get('days', 30, type=int)
+    if trend_days not in TREND_RANGES:
+        trend_days = 30
+    return render_template("productivity_report.html", trend_days=trend_days, trend_ranges=TREND_RANGES)
+
+#------------------------------------Route Displays tasks filtered by time period.---------------------------------------#
+RECURRING_LOOKAHEAD_DAYS = 14  # Recurring occurrences listed under the "All" filter
+
+def filter_range(filter_by, today):
+    """Date range shown by the Today/Week/Month/All filter, used to expand recurring tasks."""
+    if filter_by == 'today':
+        return day_range(today)
+    if filter_by == 'week':
+        return week_range(today)
+    if filter_by == 'month':
+        return month_range(today)
+    return today, today + timedelta(days=RECURRING_LOOKAHEAD_DAYS)
+
+def filtered_task_query(filter_by, today):
+    """Tasks for the Today/Week/Month/All filter used by the task manager."""
+    if filter_by == 'today':
+        return Task.query.filter(Task.date == today)
+    if filter_by == 'week':
+        return Task.query.filter(in_period(Task.date, week_range(today)))
+    if filter_by == 'month':
+        return Task.query.filter(in_period(Task.date, month_range(today)))
+    return Task.query
+
+
+@bp.route('/task_manager')
+def task_manager():
+    """Display tasks filtered by Today, Week, Month, or All."""
+    filter_by = request.args.get('filter', 'all')
+    try:
+        per_page, cursor = page_args(date.fromisoformat, allow_all=True)
+    except ValueError:
+        return "Invalid cursor", 400
+
+    today = datetime.today().date()
+    query = filtered_task_query(filter_by, today)
+    # Rows are read while the page streams out, so even ?per_page=all starts sending at once in flat memory
+    tasks = StreamedPage(query, Task.date, Task.id, cursor, per_page)
+    # Recurring occurrences aren't rows, so they are listed once above the first page
+    occurrences = [] if cursor else expand_occurrences(*filter_range(filter_by, today))
+
+    return stream_page('task_manager.html', tasks=tasks, occurrences=occurrences, filter_by=filter_by,
+                       per_page=per_page, cursor=cursor)
+
+#------------------------------Route serving the task manager page as JSON for "load more"-------------------------------#
+def task_json(task):
+    return {
+        'id': task.id,
+        'description': task.description,
+        'date': task.date.isoformat(),
+        'completed': bool(task.completed)
+    }
+
+@bp.route('/api/tasks')
+def api_tasks():
+    try:
+        per_page, cursor = page_args(date.fromisoformat)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    query = filtered_task_query(request.args.get('filter', 'all'), datetime.today().date())
+    tasks, next_cursor = keyset_page(query, Task.date, Task.id, cursor, per_page)
+    return jsonify({
+        'tasks': [task_json(task) for task in tasks],
+        'next_cursor': next_cursor
+    })
+
+#------------------------------Route applying many task changes in one transaction--------------------------------------#
+MAX_BATCH_OPERATIONS = 500
+
+def parse_batch_operation(item):
+    """Validate one batch item. Returns ('create', row dict) or ('complete'/'delete', task id); raises ValueError."""
+    if not isinstance(item, dict):
+        raise ValueError("operation must be an object")
+    op = item.get('op')
+    if op == 'create':
+        description = item.get('description')
+        if not isinstance(description, str) or not description.strip():
+            raise ValueError("description is required")
+        try:
+            task_date = date.fromisoformat(str(item.get('date')))
+        except ValueError:
+            raise ValueError("date must be YYYY-MM-DD")
+        return op, {'description': description.strip()[:200], 'date': task_date, 'completed': False}
+    if op in ('complete', 'delete'):
+        task_id = item.get('id')
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            raise ValueError("id must be an integer")
+        return op, task_id
+    raise ValueError("op must be create, complete or delete")
+
+@bp.route('/api/tasks/batch', methods=['POST'])
+def api_tasks_batch():
+    """Apply create/complete/delete operations in one transaction and report a result per item.
+
+    Body: {"operations": [{"op": "create", "description": ..., "date": "YYYY-MM-DD"},
+                          {"op": "complete", "id": 1}, {"op": "delete", "id": 2}, ...]}
+    Creates run first, then completes, then deletes, each as a single statement.
+    """
+    data = request.get_json(silent=True)
+    operations = data.get('operations') if isinstance(data, dict) else data
+    if not isinstance(operations, list):
+        return jsonify({'error': 'Expected a JSON list of operations'}), 400
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return jsonify({'error': f'At most {MAX_BATCH_OPERATIONS} operations per batch'}), 400
+
+    results = [None] * len(operations)
+    creates, ids = [], {'complete': [], 'delete': []}
+    for index, item in enumerate(operations):
+        try:
+            op, value = parse_batch_operation(item)
+        except ValueError as e:
+            results[index] = {'op': item.get('op') if isinstance(item, dict) else None,
+                              'status': 'error', 'error': str(e)}
+            continue
+        if op == 'create':
+            creates.append((index, value))
+        else:
+            ids[op].append((index, value))
+
+    if creates:
+        rows = db.session.execute(
+            insert(Task).returning(Task.id, Task.description, Task.date, Task.completed,
+                                   sort_by_parameter_order=True),
+            [row for _, row in creates]
+        ).all()
+        for (index, _), task in zip(creates, rows):
+            results[index] = {'op': 'create', 'status': 'created', 'id': task.id, 'task': task_json(task)}
+
+    statements = {
+        'complete': update(Task).values(completed=True),
+        'delete': delete(Task),
+    }
+    for op, items in ids.items():
+        if not items:
+            continue
+        wanted = {task_id for _, task_id in items}
+        stmt = statements[op].where(Task.id.in_(wanted)).returning(Task.id)
+        found = set(db.session.execute(stmt, execution_options={'synchronize_session': False}).scalars())
+        for index, task_id in items:
+            status = ('completed' if op == 'complete' else 'deleted') if task_id in found else 'not_found'
+            results[index] = {'op': op, 'status': status, 'id': task_id}
+
+    db.session.commit()
+    if creates or ids['complete'] or ids['delete']:
+        response_cache.invalidate('tasks')
+    return jsonify({'results': results})
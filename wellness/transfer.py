@@ -0,0 +1,356 @@
+"""Bulk import and streaming export of tasks, expenses and water logs.
+
+Imports read UTF-8 CSV (with a header row) or JSON lines one record at a
+time. Valid rows are inserted in batches with a single executemany per
+batch, and each batch is committed on its own. Invalid rows are skipped and
+reported by line number. A CSV file that can't be read any further (bad
+encoding or broken quoting) stops the import at that line, after the valid
+rows before it have been committed. Exports stream rows from a server-side cursor, so
+memory use stays flat however large the table is.
+"""
+import csv
+import io
+import json
+import math
+from datetime import date, datetime
+
+import click
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from sqlalchemy import insert, select
+
+from .expenses import record_expenses_in_rollup
+from .extensions import db, response_cache
+from .models import Expense, ExpenseCategory, Task, WaterLog
+from .water import add_to_water_daily
+
+bp = Blueprint('transfer', __name__, cli_group=None)
+
+IMPORT_BATCH_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+MAX_NUMBER = 10 ** 9  # amounts and ids above this are typos (or 1e308), not data
+FORMATS = ('csv', 'jsonl')
+
+#------------------------------------------- Record parsing and validation -------------------------------------------#
+
+class UnreadableInput(ValueError):
+    """The input can't be read past `line`, so the import stops there."""
+
+    def __init__(self, line, message):
+        super().__init__(message)
+        self.line = line
+
+def _decode(raw, line_no):
+    try:
+        return raw.decode('utf-8-sig' if line_no == 1 else 'utf-8')
+    except UnicodeDecodeError as e:
+        raise UnreadableInput(line_no, f"not valid UTF-8 (byte {e.start + 1} of the line)")
+
+def read_records(stream, fmt):
+    """Yield (line number, dict) for each record of a binary stream of CSV or JSON lines.
+
+    A line that can't be parsed is yielded as (line number, ValueError) so the caller can report it and keep
+    going. Lines are decoded one at a time, so a bad byte is reported at its own line: a JSON line is skipped,
+    while CSV (whose quoted fields can span lines) raises UnreadableInput, as does malformed CSV quoting.
+    """
+    if fmt == 'csv':
+        lines_read = 0
+
+        def lines():
+            nonlocal lines_read
+            for lines_read, raw in enumerate(stream, start=1):
+                yield _decode(raw, lines_read)
+
+        reader = csv.DictReader(lines(), strict=True)
+        try:
+            for record in reader:
+                yield reader.line_num, record
+        except csv.Error as e:
+            raise UnreadableInput(lines_read, f"malformed CSV: {e}")
+        return
+    for line_no, raw in enumerate(stream, start=1):
+        try:
+            line = _decode(raw, line_no)
+        except UnreadableInput as e:
+            yield line_no, e
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, ValueError(f"invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            record = ValueError("expected a JSON object")
+        yield line_no, record
+
+def _required(record, field):
+    value = record.get(field)
+    if value is None or str(value).strip() == '':
+        raise ValueError(f"{field} is required")
+    return str(value).strip() if isinstance(value, str) else value
+
+def _parse_date(value, field):
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        raise ValueError(f"{field} must be a YYYY-MM-DD date, got {value!r}")
+
+def _parse_datetime(value, field):
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"{field} must be an ISO date or datetime, got {value!r}")
+    # Timestamps are stored as naive local time like the ones the forms record
+    return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+
+def _parse_number(value, field, kind=float):
+    try:
+        number = kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a number, got {value!r}")
+    if not math.isfinite(number):
+        raise ValueError(f"{field} must be a finite number, got {value!r}")
+    if number < 0:
+        raise ValueError(f"{field} must not be negative")
+    if number > MAX_NUMBER:
+        raise ValueError(f"{field} must be at most {MAX_NUMBER}, got {value!r}")
+    return number
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value or '').strip().lower()
+    if text in ('', '0', 'false', 'no', 'n'):
+        return False
+    if text in ('1', 'true', 'yes', 'y'):
+        return True
+    raise ValueError(f"completed must be true or false, got {value!r}")
+
+def parse_task(record, context):
+    description = _required(record, 'description')
+    if len(description) > 200:
+        raise ValueError("description is longer than 200 characters")
+    return {
+        'description': description,
+        'date': _parse_date(_required(record, 'date'), 'date'),
+        'completed': _parse_bool(record.get('completed'))
+    }
+
+def parse_expense(record, context):
+    """An expense row; the category can be given as category_id or by name in category."""
+    description = _required(record, 'description')
+    if len(description) > 200:
+        raise ValueError("description is longer than 200 characters")
+    category_id = record.get('category_id')
+    if category_id not in (None, ''):
+        category_id = _parse_number(category_id, 'category_id', int)
+        if category_id not in context['category_ids']:
+            raise ValueError(f"unknown category_id {category_id}")
+    elif record.get('category'):
+        category_id = context['categories'].get(str(record['category']).strip().lower())
+        if category_id is None:
+            raise ValueError(f"unknown category {record['category']!r}")
+    else:
+        category_id = None
+    return {
+        'description': description,
+        'amount': _parse_number(_required(record, 'amount'), 'amount'),
+        'timestamp': _parse_datetime(_required(record, 'timestamp'), 'timestamp'),
+        'category_id': category_id
+    }
+
+def parse_water(record, context):
+    return {
+        'amount': _parse_number(_required(record, 'amount'), 'amount', int),
+        'timestamp': _parse_datetime(_required(record, 'timestamp'), 'timestamp')
+    }
+
+def expense_context():
+    categories = db.session.query(ExpenseCategory.id, ExpenseCategory.name).all()
+    return {
+        'categories': {name.lower(): category_id for category_id, name in categories},
+        'category_ids': {category_id for category_id, _ in categories}
+    }
+
+def after_expense_batch(rows):
+    record_expenses_in_rollup(rows)
+
+def after_water_batch(rows):
+    totals = {}
+    for row in rows:
+        day = row['timestamp'].date()
+        totals[day] = totals.get(day, 0) + row['amount']
+    for day, amount in totals.items():
+        add_to_water_daily(day, amount)
+
+# kind -> (model, row parser, lookup context loader, per-batch hook run in the batch's transaction, cache tag)
+IMPORTERS = {
+    'tasks': (Task, parse_task, dict, None, 'tasks'),
+    'expenses': (Expense, parse_expense, expense_context, after_expense_batch, 'expenses'),
+    'water': (WaterLog, parse_water, dict, after_water_batch, None),
+}
+
+#------------------------------------------------ Batched import ----------------------------------------------------#
+
+def import_records(kind, records, batch_size=IMPORT_BATCH_SIZE, dry_run=False):
+    """Validate and insert (line number, record) pairs of one kind in batches.
+
+    Returns {'imported', 'failed', 'errors', 'stopped_at'}, where errors lists the first MAX_REPORTED_ERRORS as
+    {'line', 'error'} and stopped_at is the line that couldn't be read (None if the whole input was read).
+    With dry_run nothing is written and 'imported' counts the rows that would have been.
+    """
+    model, parse, load_context, after_batch, cache_tag = IMPORTERS[kind]
+    context = load_context()
+    imported = failed = 0
+    errors = []
+    batch = []
+    stopped_at = None
+
+    def flush():
+        nonlocal imported
+        if not batch:
+            return
+        if not dry_run:
+            db.session.execute(insert(model), batch)
+            if after_batch:
+                after_batch(batch)
+            db.session.commit()
+        imported += len(batch)
+        batch.clear()
+
+    def report(line_no, error):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({'line': line_no, 'error': str(error)})
+
+    try:
+        for line_no, record in records:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                batch.append(parse(record, context))
+            except ValueError as e:
+                report(line_no, e)
+                continue
+            if len(batch) >= batch_size:
+                flush()
+    except UnreadableInput as e:
+        # Keep everything before the unreadable line, so a fixed file can be resumed from there
+        report(e.line, e)
+        stopped_at = e.line
+    flush()
+
+    if imported and not dry_run and cache_tag:
+        response_cache.invalidate(cache_tag)
+    return {'imported': imported, 'failed': failed, 'errors': errors, 'stopped_at': stopped_at}
+
+def guess_format(filename, default='csv'):
+    if filename and filename.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if filename and filename.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+#------------------------------------------------ Streaming export --------------------------------------------------#
+EXPORT_COLUMNS = {
+    'tasks': ['id', 'description', 'date', 'completed'],
+    'expenses': ['id', 'description', 'amount', 'timestamp', 'category_id', 'category'],
+    'water': ['id', 'timestamp', 'amount'],
+}
+
+def export_query(kind):
+    if kind == 'tasks':
+        return select(Task.id, Task.description, Task.date, Task.completed).order_by(Task.id)
+    if kind == 'expenses':
+        return select(
+            Expense.id, Expense.description, Expense.amount, Expense.timestamp, Expense.category_id,
+            ExpenseCategory.name.label('category')
+        ).outerjoin(ExpenseCategory, Expense.category_id == ExpenseCategory.id).order_by(Expense.id)
+    return select(WaterLog.id, WaterLog.timestamp, WaterLog.amount).order_by(WaterLog.id)
+
+def export_rows(kind):
+    """Yield the rows of one kind as dicts, fetched EXPORT_BATCH_SIZE at a time from a server-side cursor."""
+    stmt = export_query(kind).execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    for row in db.session.execute(stmt):
+        yield {
+            column: value.isoformat() if isinstance(value, (date, datetime)) else value
+            for column, value in row._mapping.items()
+        }
+
+def export_lines(kind, fmt):
+    """Yield the export as text chunks: a CSV header and rows, or one JSON object per line."""
+    if fmt == 'jsonl':
+        for row in export_rows(kind):
+            yield json.dumps(row) + '\n'
+        return
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS[kind])
+    writer.writeheader()
+    for row in export_rows(kind):
+        writer.writerow(row)
+        if buffer.tell() > 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+#------------------------------------------- Routes for bulk import/export -------------------------------------------#
+@bp.route('/api/import/<kind>', methods=['POST'])
+def import_data(kind):
+    """Import an uploaded file (form field `file`) or the raw request body. ?format=csv|jsonl, ?dry_run=1."""
+    if kind not in IMPORTERS:
+        return jsonify({'error': f"Unknown kind {kind!r}"}), 404
+    upload = request.files.get('file')
+    fmt = request.args.get('format') or guess_format(
+        upload.filename if upload else None,
+        'jsonl' if 'json' in (request.mimetype or '') else 'csv'
+    )
+    if fmt not in FORMATS:
+        return jsonify({'error': f"format must be one of {', '.join(FORMATS)}"}), 400
+
+    stream = upload.stream if upload else request.stream
+    result = import_records(kind, read_records(stream, fmt), dry_run=request.args.get('dry_run') == '1')
+    return jsonify(result), 400 if result['stopped_at'] else 200
+
+@bp.route('/api/export/<kind>.<fmt>')
+def export_data(kind, fmt):
+    if kind not in IMPORTERS or fmt not in FORMATS:
+        return jsonify({'error': 'Unknown export'}), 404
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    return Response(
+        stream_with_context(export_lines(kind, fmt)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={kind}.{fmt}'}
+    )
+
+#------------------------------------------- CLI commands for bulk import/export -------------------------------------#
+@bp.cli.command('import-data')
+@click.argument('kind', type=click.Choice(list(IMPORTERS)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), help='Defaults to the file extension.')
+@click.option('--batch-size', default=IMPORT_BATCH_SIZE, show_default=True)
+@click.option('--dry-run', is_flag=True, help='Validate only; write nothing.')
+def import_data_command(kind, path, fmt, batch_size, dry_run):
+    """Import tasks, expenses or water logs from a CSV or JSON-lines file."""
+    with open(path, 'rb') as stream:
+        result = import_records(kind, read_records(stream, fmt or guess_format(path)), batch_size, dry_run)
+    for error in result['errors']:
+        print(f"line {error['line']}: {error['error']}")
+    print(f"{'Validated' if dry_run else 'Imported'} {result['imported']} {kind}, {result['failed']} failed")
+    if result['stopped_at']:
+        print(f"Stopped at line {result['stopped_at']}: the rest of the file was not read")
+    if result['failed']:
+        raise SystemExit(1)
+
+@bp.cli.command('export-data')
+@click.argument('kind', type=click.Choice(list(IMPORTERS)))
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), help='Defaults to the file extension.')
+def export_data_command(kind, path, fmt):
+    """Export tasks, expenses or water logs to a CSV or JSON-lines file."""
+    with open(path, 'w', encoding='utf-8', newline='') as out:
+        for chunk in export_lines(kind, fmt or guess_format(path)):
+            out.write(chunk)
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+from flask import Blueprint, flash, redirect, render_template, request, url_for
+from sqlalchemy import func, select
+
+from .database import upsert
+from .extensions import db
+from .helpers import day_range, in_period
+from .models import DEFAULT_WATER_GOAL, WaterDaily, WaterLog
+
+bp = Blueprint('water', __name__)
+
+#--------------------------------------Route for Water intake------------------------------------------------------#
+WATER_HISTORY_DAYS = 7
+
+def latest_water_goal():
+    """Goal for a day without a summary row yet: the most recent stored goal, or the default."""
+    return func.coalesce(
+        select(WaterDaily.target).order_by(WaterDaily.day.desc()).limit(1).scalar_subquery(),
+        DEFAULT_WATER_GOAL
+    )
+
+def water_summary(day):
+    """(total, goal) for `day` in one select; a day without a summary row yet has 0 and the latest stored goal."""
+    on_day = WaterDaily.day == day
+    return db.session.execute(select(
+        func.coalesce(select(WaterDaily.total).where(on_day).scalar_subquery(), 0),
+        func.coalesce(select(WaterDaily.target).where(on_day).scalar_subquery(), latest_water_goal())
+    )).one()
+
+def add_to_water_daily(day, amount):
+    """Add to the day's running total in the caller's transaction, creating the row if needed."""
+    stmt = upsert(WaterDaily).values(day=day, total=amount, target=latest_water_goal())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['day'],
+        set_={'total': WaterDaily.total + stmt.excluded.total}
+    )
+    db.session.execute(stmt)
+
+def water_history(today, days=WATER_HISTORY_DAYS):
+    """Daily summary rows for the last `days` days up to today, oldest first (days without intake are absent)."""
+    return WaterDaily.query.filter(
+        in_period(WaterDaily.day, (today - timedelta(days=days - 1), today + timedelta(days=1)))
+    ).order_by(WaterDaily.day).all()
+
+@bp.route('/water_intake', methods=['GET', 'POST'])
+def water_intake():
+    if request.method == 'POST':
+        amount = request.form.get('amount')
+        if amount and amount.isdigit():
+            new_entry = WaterLog(amount=int(amount), timestamp=datetime.now())
+            db.session.add(new_entry)
+            add_to_water_daily(new_entry.timestamp.date(), new_entry.amount)
+            db.session.commit()
+            flash('Water intake added!', 'success')  # Optional confirmation
+            return redirect(url_for('water.water_intake'))
+
+    today = datetime.today().date()
+    records = WaterLog.query.filter(in_period(WaterLog.timestamp, day_range(today))).order_by(WaterLog.timestamp).all()
+
+    # Today's total and goal come from the single summary row
+    total_intake, daily_goal = water_summary(today)
+    progress = total_intake / daily_goal * 100 if daily_goal else 0
+
+    # The history chart loads its data from /api/charts/water-history
+    return render_template('water_intake.html',
+                         records=records,
+                         total_intake=total_intake,
+                         daily_goal=daily_goal,
+                         progress=progress,
+                         history_days=WATER_HISTORY_DAYS)
+
+#------------------------------------Route to set today's water goal------------------------------------------------#
+@bp.route('/water_goal', methods=['POST'])
+def water_goal():
+    goal = request.form.get('goal')
+    if goal and goal.isdigit() and int(goal) > 0:
+        stmt = upsert(WaterDaily).values(day=datetime.today().date(), total=0, target=int(goal))
+        stmt = stmt.on_conflict_do_update(index_elements=['day'], set_={'target': stmt.excluded.target})
+        db.session.execute(stmt)
+        db.session.commit()
+        flash('Daily goal updated', 'success')
+    return redirect(url_for('water.water_intake'))
+
+#------------------------------------Route to reset Water Intake------------------------------------------------#
+@bp.route('/reset_water', methods=['POST'])
+def reset_water():
+    # Delete today's records from DATABASE (not session)
+    today = datetime.today().date()
+    WaterLog.query.filter(in_period(WaterLog.timestamp, day_range(today))).delete()
+    WaterDaily.query.filter(WaterDaily.day == today).update({'total': 0})
+    db.session.commit()
+    flash('Water log reset successfully', 'success')
+    return redirect(url_for('water.water_intake'))
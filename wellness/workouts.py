@@ -0,0 +1,101 @@
+import random
+from datetime import timedelta
+
+import requests
+from flask import Blueprint, current_app, render_template, request
+
+from .database import upsert
+from .extensions import db, exercise_cache, job_runner
+from .models import Exercise
+
+bp = Blueprint('workouts', __name__, cli_group=None)
+
+#-----------------------------Exercise catalog prefetched from API Ninjas------------------------------------------#
+EXERCISE_MUSCLES = [
+    'abdominals', 'abductors', 'adductors', 'biceps', 'calves', 'chest', 'forearms', 'glutes',
+    'hamstrings', 'lats', 'lower_back', 'middle_back', 'neck', 'quadriceps', 'traps', 'triceps'
+]
+EXERCISE_TYPES = [
+    'cardio', 'olympic_weightlifting', 'plyometrics', 'powerlifting', 'strength', 'stretching', 'strongman'
+]
+EXERCISE_DIFFICULTIES = ['beginner', 'intermediate', 'expert']
+
+def store_exercises(exercises):
+    """Insert or refresh API exercise dicts in the local catalog."""
+    rows = [{
+        'name': exercise['name'],
+        'type': exercise.get('type'),
+        'muscle': exercise['muscle'],
+        'equipment': exercise.get('equipment'),
+        'difficulty': exercise.get('difficulty'),
+        'instructions': exercise.get('instructions')
+    } for exercise in exercises if exercise.get('name') and exercise.get('muscle')]
+    if not rows:
+        return
+    stmt = upsert(Exercise)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['muscle', 'name'],
+        set_={column: stmt.excluded[column] for column in ('type', 'equipment', 'difficulty', 'instructions')}
+    )
+    db.session.execute(stmt, rows)
+    db.session.commit()
+
+def prefetch_exercise_catalog():
+    """Fetch every muscle group from the API into the catalog. Returns the muscles that failed."""
+    failed = []
+    for muscle in EXERCISE_MUSCLES:
+        try:
+            store_exercises(exercise_cache.fetch(muscle))
+        except requests.RequestException:
+            failed.append(muscle)
+    return failed
+
+@job_runner.periodic('prefetch_exercises', hours=24, run_after=timedelta(minutes=1))
+def prefetch_exercise_catalog_job():
+    failed = prefetch_exercise_catalog()
+    if failed:
+        current_app.logger.warning("Exercise prefetch failed for: %s", ', '.join(failed))
+
+def random_exercise(muscle='', type='', difficulty=''):
+    """Pick a random catalog exercise matching the filters: an indexed COUNT, then one row at a random offset."""
+    query = Exercise.query
+    if muscle:
+        query = query.filter(Exercise.muscle == muscle)
+    if type:
+        query = query.filter(Exercise.type == type)
+    if difficulty:
+        query = query.filter(Exercise.difficulty == difficulty)
+    total = query.count()
+    if not total:
+        return None
+    return query.order_by(Exercise.id).offset(random.randrange(total)).first()
+
+@bp.cli.command('prefetch-exercises')
+def prefetch_exercises_command():
+    """Load every muscle group from API Ninjas into the local exercise catalog."""
+    failed = prefetch_exercise_catalog()
+    print(f"Exercise catalog has {Exercise.query.count()} exercises")
+    if failed:
+        raise SystemExit(f"Failed to fetch: {', '.join(failed)}")
+
+#-----------------------------Route Fetches random workout suggestions based on a muscle group---------------------#
+@bp.route('/workouts', methods=['GET', 'POST'])
+def workouts():
+    filters = {name: request.form.get(name, '') for name in ('muscle', 'type', 'difficulty')}
+    choices = {'muscles': EXERCISE_MUSCLES, 'types': EXERCISE_TYPES, 'difficulties': EXERCISE_DIFFICULTIES}
+    if request.method == 'POST':
+        error = None
+        workout = random_exercise(**filters)
+        if workout is None:
+            # Nothing local yet (e.g. before the first prefetch): fill this muscle group from the API once
+            try:
+                store_exercises(exercise_cache.get(filters['muscle'] or random.choice(EXERCISE_MUSCLES)))
+                workout = random_exercise(**filters)
+            except requests.RequestException as e:
+                error = f"An error occurred while fetching data: {e}"
+        if workout:
+            return render_template('workouts.html', workout=workout, filters=filters, **choices)
+        return render_template('workouts.html', workout=None, error=error or "No exercises found.",
+                               filters=filters, **choices)
+
+    return render_template('workouts.html', workout=None, filters=filters, **choices)